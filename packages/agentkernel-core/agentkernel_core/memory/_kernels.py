@@ -0,0 +1,75 @@
+"""Numeric kernels for memory retrieval scoring.
+
+Scoring, importance filtering and top-k selection run over a contiguous
+(N, D) float32 matrix so only the surviving hits are turned into Python
+objects. When numba is installed the scoring loop is JIT-compiled into a
+parallel kernel; otherwise an equivalent numpy expression is used.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def _masked_scores_numpy(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    importance: np.ndarray,
+    min_importance: float,
+) -> np.ndarray:
+    """Dot-product scores, with rows below ``min_importance`` set to -inf."""
+    scores = matrix @ query
+    return np.where(importance >= min_importance, scores, np.float32(-np.inf))
+
+
+try:
+    from numba import njit, prange
+except ImportError:
+    _masked_scores = _masked_scores_numpy
+else:
+
+    @njit(parallel=True, cache=True)
+    def _masked_scores(query, matrix, importance, min_importance):
+        """JIT-compiled equivalent of ``_masked_scores_numpy``."""
+        n, d = matrix.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            if importance[i] < min_importance:
+                scores[i] = -np.inf
+                continue
+            acc = 0.0
+            for j in range(d):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        return scores
+
+
+def score_topk(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    importance: np.ndarray,
+    min_importance: float,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Score rows against a query and keep the best ``k`` eligible ones.
+
+    Args:
+        query: Query embedding of shape (D,), float32.
+        matrix: Candidate embeddings of shape (N, D), float32.
+        importance: Per-row importance of shape (N,); rows below
+            ``min_importance`` are never selected.
+        min_importance: Minimum importance for a row to be eligible.
+        k: Maximum number of rows to return.
+
+    Returns:
+        Tuple of (row indices, scores), best first.
+    """
+    scores = _masked_scores(query, matrix, importance, np.float32(min_importance))
+    eligible = np.flatnonzero(np.isfinite(scores))
+    if k <= 0 or eligible.size == 0:
+        return eligible[:0], scores[:0]
+
+    if eligible.size > k:
+        eligible = eligible[np.argpartition(-scores[eligible], k - 1)[:k]]
+    order = eligible[np.argsort(-scores[eligible], kind="stable")]
+    return order, scores[order]
@@ -98,13 +98,14 @@ class GraphMemory(GraphMemoryModule):
         if not props:
             return None
 
+        now = datetime.now()
         return GraphNode(
             id=agent_id,
             label=props.get("label", agent_id),
             node_type=props.get("node_type", "agent"),
             properties={k: v for k, v in props.items() if k not in ("label", "node_type", "created_at", "updated_at")},
-            created_at=datetime.fromisoformat(props["created_at"]) if props.get("created_at") else datetime.now(),
-            updated_at=datetime.fromisoformat(props["updated_at"]) if props.get("updated_at") else datetime.now(),
+            created_at=datetime.fromisoformat(props["created_at"]) if props.get("created_at") else now,
+            updated_at=datetime.fromisoformat(props["updated_at"]) if props.get("updated_at") else now,
         )
 
     async def add_relation(
@@ -184,6 +185,7 @@ class GraphMemory(GraphMemoryModule):
         if not props:
             return None
 
+        now = datetime.now()
         return RelationEdge(
             source_id=source_id,
             target_id=target_id,
@@ -192,8 +194,8 @@ class GraphMemory(GraphMemoryModule):
             bidirectional=True,  # Assume bidirectional
             properties={k: v for k, v in props.items() if k not in ("relation_type", "weight", "interaction_count", "created_at", "updated_at")},
             interaction_count=props.get("interaction_count", 0),
-            created_at=datetime.fromisoformat(props["created_at"]) if props.get("created_at") else datetime.now(),
-            updated_at=datetime.fromisoformat(props["updated_at"]) if props.get("updated_at") else datetime.now(),
+            created_at=datetime.fromisoformat(props["created_at"]) if props.get("created_at") else now,
+            updated_at=datetime.fromisoformat(props["updated_at"]) if props.get("updated_at") else now,
         )
 
     async def record_interaction(
@@ -315,7 +317,7 @@ class GraphMemory(GraphMemoryModule):
                     weight=weight,
                     interaction_count=edge_data.get("interaction_count", 0),
                 )
-                subgraph.edges.append(edge)
+                subgraph.add_edge(edge)
 
         return subgraph
 
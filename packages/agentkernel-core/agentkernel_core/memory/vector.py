@@ -11,6 +11,9 @@ import time
 import uuid
 from typing import Any, Callable, Coroutine, Dict, List, Optional
 
+import numpy as np
+
+from agentkernel_core.memory._kernels import score_topk
 from agentkernel_core.memory.interfaces import MemoryModule
 from agentkernel_core.toolkit.storages.vectordb_adapters.base import BaseVectorDBAdapter
 from agentkernel_core.types.schemas.memory import (
@@ -26,6 +29,20 @@ from agentkernel_core.types.schemas.vectordb import (
 
 logger = logging.getLogger(__name__)
 
+# Candidates fetched per requested hit when MemoryQuery.rerank is set
+_RERANK_CANDIDATE_FACTOR = 4
+
+
+def _as_list(vector: Optional[Any]) -> Optional[List[float]]:
+    """Convert a numpy embedding to the plain list VectorDocument expects."""
+    return vector.tolist() if isinstance(vector, np.ndarray) else vector
+
+
+def _normalized(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors to unit length along the last axis so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.ascontiguousarray(vectors / np.where(norms > 0, norms, 1), dtype=np.float32)
+
 
 class VectorMemory(MemoryModule):
     """Vector-based memory storage using VectorDB adapters.
@@ -87,7 +104,7 @@ class VectorMemory(MemoryModule):
             content=record.content,
             tick=record.tick,
             timestamp=record.timestamp.timestamp() if record.timestamp else None,
-            vector=vector,
+            vector=_as_list(vector),
             agent_id=record.agent_id,
             doc_type=record.memory_type.value,
             metadata={
@@ -131,7 +148,7 @@ class VectorMemory(MemoryModule):
                 content=record.content,
                 tick=record.tick,
                 timestamp=record.timestamp.timestamp() if record.timestamp else None,
-                vector=vector,
+                vector=_as_list(vector),
                 agent_id=record.agent_id,
                 doc_type=record.memory_type.value,
                 metadata={
@@ -170,22 +187,25 @@ class VectorMemory(MemoryModule):
             logger.warning("No query vector available for retrieval")
             return []
 
-        # Build search request
-        request = VectorSearchRequest(
-            query=query_vector,
-            top_k=query.top_k,
+        # Over-fetch candidates when reranking locally
+        fetch_k = min(query.top_k * _RERANK_CANDIDATE_FACTOR, 100) if query.rerank else query.top_k
+
+        # Build search request; MemoryQuery already bounds top_k to [1, 100]
+        request = VectorSearchRequest.trusted(
+            query=_as_list(query_vector),
+            top_k=fetch_k,
             agent_id=query.agent_id,
             doc_type=query.memory_types[0].value if query.memory_types else None,
+            with_vectors=query.rerank,
         )
 
         # Execute search
         results = await self._adapter.search(request)
 
-        # Convert to MemoryHit
-        hits = []
+        # Apply metadata filters before building any MemoryRecord
+        candidates = []
         for result in results:
-            doc = result.document
-            metadata = doc.metadata or {}
+            metadata = result.document.metadata or {}
 
             # Filter by importance if specified
             importance = metadata.get("importance", 0.5)
@@ -198,6 +218,30 @@ class VectorMemory(MemoryModule):
                 if not any(a in related_agents for a in query.include_related_agents):
                     continue
 
+            candidates.append((result, importance))
+
+        if query.rerank and candidates and all(r.document.vector for r, _ in candidates):
+            # Exact cosine rescoring and top-k in one pass over a (N, D) matrix
+            indices, scores = score_topk(
+                _normalized(np.asarray(query_vector, dtype=np.float32)),
+                _normalized(np.asarray([r.document.vector for r, _ in candidates], dtype=np.float32)),
+                np.fromiter((imp for _, imp in candidates), dtype=np.float32, count=len(candidates)),
+                query.min_importance,
+                query.top_k,
+            )
+            selected = [
+                (candidates[i][0], candidates[i][1], max(score, 0.0))
+                for i, score in zip(indices.tolist(), scores.tolist())
+            ]
+        else:
+            selected = [(result, importance, result.score) for result, importance in candidates[: query.top_k]]
+
+        # Convert to MemoryHit
+        hits = []
+        for result, importance, score in selected:
+            doc = result.document
+            metadata = doc.metadata or {}
+
             record = MemoryRecord(
                 id=doc.id,
                 agent_id=doc.agent_id or "",
@@ -206,7 +250,7 @@ class VectorMemory(MemoryModule):
                 tick=doc.tick,
                 importance=importance,
                 vector=doc.vector,
-                related_agents=related_agents,
+                related_agents=metadata.get("related_agents", []),
                 related_memories=metadata.get("related_memories", []),
                 metadata={k: v for k, v in metadata.items() if k not in ("importance", "related_agents", "related_memories")},
             )
@@ -214,7 +258,7 @@ class VectorMemory(MemoryModule):
             # Update access statistics
             record.increment_access()
 
-            hits.append(MemoryHit(record=record, score=result.score))
+            hits.append(MemoryHit(record=record, score=score))
 
         return hits
 
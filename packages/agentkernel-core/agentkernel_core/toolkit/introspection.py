@@ -0,0 +1,156 @@
+"""Cached callable introspection shared by tool specs and action plugins.
+
+Signatures, type hints and parameter JSON Schemas never change for a given
+function, so they are computed once per function. The returned schemas are
+shared between callers and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, List, Union, get_args, get_origin, get_type_hints
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["input_schema", "python_type_to_json_schema"]
+
+# Leaf schemas shared by every converted parameter (read-only)
+_STRING_SCHEMA: Dict[str, Any] = {"type": "string"}
+_INTEGER_SCHEMA: Dict[str, Any] = {"type": "integer"}
+_NUMBER_SCHEMA: Dict[str, Any] = {"type": "number"}
+_BOOLEAN_SCHEMA: Dict[str, Any] = {"type": "boolean"}
+_NULL_SCHEMA: Dict[str, Any] = {"type": "null"}
+_OBJECT_SCHEMA: Dict[str, Any] = {"type": "object"}
+
+# Parameter kinds that can receive the instance of a bound method
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+# Errors get_type_hints raises for annotations that cannot be resolved
+_UNRESOLVABLE_HINT_ERRORS = (NameError, AttributeError, TypeError)
+
+
+def python_type_to_json_schema(python_type: Any) -> Dict[str, Any]:
+    """Convert a Python type to JSON Schema type.
+
+    Unknown types, including a missing annotation (``None``), map to string.
+
+    Args:
+        python_type: The Python type to convert.
+
+    Returns:
+        JSON Schema type definition, shared between callers.
+    """
+    try:
+        return _type_to_json_schema_cached(python_type)
+    except TypeError:
+        # Unhashable type expressions (e.g. Annotated with list metadata)
+        return _type_to_json_schema_cached.__wrapped__(python_type)
+
+
+@functools.lru_cache(maxsize=512)
+def _type_to_json_schema_cached(python_type: Any) -> Dict[str, Any]:
+    """Uncached body of ``python_type_to_json_schema``."""
+    # Basic types (identity checks; these are singletons)
+    if python_type is str:
+        return _STRING_SCHEMA
+    if python_type is int:
+        return _INTEGER_SCHEMA
+    if python_type is float:
+        return _NUMBER_SCHEMA
+    if python_type is bool:
+        return _BOOLEAN_SCHEMA
+    if python_type is type(None):
+        return _NULL_SCHEMA
+
+    origin = get_origin(python_type)
+    args = get_args(python_type)
+
+    # Handle Optional (Union with None)
+    if origin is Union and type(None) in args:
+        non_none_args = [a for a in args if a is not type(None)]
+        if len(non_none_args) == 1:
+            return python_type_to_json_schema(non_none_args[0])
+
+    # Handle List
+    if origin is list:
+        item_type = args[0] if args else Any
+        return {"type": "array", "items": python_type_to_json_schema(item_type)}
+
+    # Handle Dict
+    if origin is dict:
+        return _OBJECT_SCHEMA
+
+    # Default to string for unknown types
+    return _STRING_SCHEMA
+
+
+def input_schema(func: Callable[..., Any], lenient: bool = False) -> Dict[str, Any]:
+    """Build the JSON Schema of a callable's parameters, once per function.
+
+    Bound methods are keyed on their underlying function, so the cache never
+    keeps an instance alive and all instances share one schema; the bound
+    instance parameter is skipped. Parameters named ``self`` or ``cls`` are
+    always skipped.
+
+    Args:
+        func: The function or bound method to introspect.
+        lenient: Fall back to untyped parameters on any error while resolving
+            type hints, not only on unresolvable annotations.
+
+    Returns:
+        JSON Schema dict describing the parameters, shared between callers.
+    """
+    target = getattr(func, "__func__", func)
+    bound = target is not func
+    try:
+        return _input_schema_cached(target, bound, lenient)
+    except TypeError:
+        # Unhashable callables skip the cache
+        return _input_schema_cached.__wrapped__(target, bound, lenient)
+
+
+@functools.lru_cache(maxsize=1024)
+def _input_schema_cached(func: Callable[..., Any], bound: bool, lenient: bool) -> Dict[str, Any]:
+    """Uncached body of ``input_schema``."""
+    sig = inspect.signature(func)
+    hints = _type_hints(func, lenient)
+
+    params = list(sig.parameters.values())
+    if bound and params and params[0].kind in _POSITIONAL_KINDS:
+        params = params[1:]
+
+    empty = inspect.Parameter.empty
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+
+    for param in params:
+        param_name = param.name
+        if param_name == "self" or param_name == "cls":
+            continue
+        properties[param_name] = python_type_to_json_schema(hints.get(param_name))
+        if param.default is empty:
+            required.append(param_name)
+
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": properties,
+    }
+    if required:
+        schema["required"] = required
+
+    return schema
+
+
+def _type_hints(func: Callable[..., Any], lenient: bool) -> Dict[str, Any]:
+    """Resolve a function's type hints, logging and skipping them when they cannot be resolved."""
+    if not hasattr(func, "__annotations__"):
+        return {}
+    try:
+        return get_type_hints(func)
+    except Exception as e:
+        if not lenient and not isinstance(e, _UNRESOLVABLE_HINT_ERRORS):
+            raise
+        logger.warning("Could not resolve type hints of %r, treating its parameters as untyped: %s", func, e)
+        return {}
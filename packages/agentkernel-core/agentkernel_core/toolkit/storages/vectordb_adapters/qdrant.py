@@ -23,6 +23,31 @@ from agentkernel_core.types.schemas.vectordb import (
 logger = logging.getLogger(__name__)
 
 
+def _point_to_document(point: Any) -> VectorDocument:
+    """Convert a Qdrant point (scored or retrieved) to a VectorDocument.
+
+    Payloads are only ever written by ``upsert`` from validated documents,
+    so the model is constructed without re-running validation.
+
+    Args:
+        point: Point returned by ``search``, ``retrieve`` or ``scroll``.
+
+    Returns:
+        The document stored in the point's payload.
+    """
+    payload = point.payload or {}
+    return VectorDocument.model_construct(
+        id=str(point.id),
+        content=payload.get("content", ""),
+        tick=payload.get("tick", 0),
+        timestamp=payload.get("timestamp"),
+        metadata=payload.get("metadata"),
+        agent_id=payload.get("agent_id"),
+        doc_type=payload.get("doc_type"),
+        vector=getattr(point, "vector", None),
+    )
+
+
 class QdrantAdapter(BaseVectorDBAdapter):
     """Qdrant vector database adapter.
 
@@ -276,27 +301,14 @@ class QdrantAdapter(BaseVectorDBAdapter):
             limit=request.top_k,
             query_filter=query_filter,
             score_threshold=request.min_score,
+            with_vectors=request.with_vectors,
         )
 
         # Convert to VectorSearchResult
-        search_results = []
-        for hit in results:
-            payload = hit.payload or {}
-            doc = VectorDocument(
-                id=str(hit.id),
-                content=payload.get("content", ""),
-                tick=payload.get("tick", 0),
-                timestamp=payload.get("timestamp"),
-                metadata=payload.get("metadata"),
-                agent_id=payload.get("agent_id"),
-                doc_type=payload.get("doc_type"),
-                vector=hit.vector if hasattr(hit, "vector") else None,
-            )
-            search_results.append(
-                VectorSearchResult(document=doc, score=hit.score)
-            )
-
-        return search_results
+        return [
+            VectorSearchResult.model_construct(document=_point_to_document(hit), score=hit.score)
+            for hit in results
+        ]
 
     async def retrieve_by_id(
         self,
@@ -321,22 +333,7 @@ class QdrantAdapter(BaseVectorDBAdapter):
             with_vectors=True,
         )
 
-        documents = []
-        for point in points:
-            payload = point.payload or {}
-            doc = VectorDocument(
-                id=str(point.id),
-                content=payload.get("content", ""),
-                tick=payload.get("tick", 0),
-                timestamp=payload.get("timestamp"),
-                metadata=payload.get("metadata"),
-                agent_id=payload.get("agent_id"),
-                doc_type=payload.get("doc_type"),
-                vector=point.vector,
-            )
-            documents.append(doc)
-
-        return documents
+        return [_point_to_document(point) for point in points]
 
     async def get_info(self) -> VectorStoreInfo:
         """Get collection information.
@@ -394,19 +391,7 @@ class QdrantAdapter(BaseVectorDBAdapter):
                 with_vectors=True,
             )
 
-            for point in points:
-                payload = point.payload or {}
-                doc = VectorDocument(
-                    id=str(point.id),
-                    content=payload.get("content", ""),
-                    tick=payload.get("tick", 0),
-                    timestamp=payload.get("timestamp"),
-                    metadata=payload.get("metadata"),
-                    agent_id=payload.get("agent_id"),
-                    doc_type=payload.get("doc_type"),
-                    vector=point.vector,
-                )
-                documents.append(doc)
+            documents.extend(_point_to_document(point) for point in points)
 
             if offset is None:
                 break
@@ -2,7 +2,7 @@
 
 from agentkernel_core.tools.sandbox.base import SandboxBase, SandboxConfig, SandboxResult
 from agentkernel_core.tools.sandbox.docker_sandbox import DockerSandbox
-from agentkernel_core.tools.sandbox.k8s_sandbox import K8sSandbox
+from agentkernel_core.tools.sandbox.k8s_sandbox import K8sSandbox, SandboxPool
 
 __all__ = [
     "SandboxBase",
@@ -10,5 +10,6 @@ __all__ = [
     "SandboxResult",
     "DockerSandbox",
     "K8sSandbox",
+    "SandboxPool",
 ]
 
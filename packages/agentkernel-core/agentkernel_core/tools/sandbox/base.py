@@ -6,15 +6,91 @@ all sandbox implementations (Docker, Kubernetes, etc.).
 
 from __future__ import annotations
 
+import ast
+import functools
 import hashlib
 import logging
+import marshal
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AnyStr, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+_TRUNCATION_SUFFIX = "\n... [OUTPUT TRUNCATED]"
+_TRUNCATION_SUFFIX_BYTES = _TRUNCATION_SUFFIX.encode("utf-8")
+
+# Framing printed by the sandbox wrapper around the user's output
+_SUCCESS_MARKER = b"__SANDBOX_SUCCESS__"
+_RESULT_START_MARKER = b"__RESULT_START__"
+_RESULT_END_MARKER = b"__RESULT_END__"
+
+# Fixed entrypoint run by every sandbox backend. User code is never templated
+# into it: it is read from the file named in argv[1], or from stdin as a
+# "<size>[ marshal <major.minor>]" header line followed by that many bytes of
+# source or marshalled bytecode.
+SANDBOX_RUNNER = """
+import json
+import marshal
+import sys
+import traceback
+
+if len(sys.argv) > 1:
+    with open(sys.argv[1], encoding="utf-8") as _f:
+        _code = _f.read()
+else:
+    _header = sys.stdin.buffer.readline().split()
+    _payload = sys.stdin.buffer.read(int(_header[0]))
+    if len(_header) > 1 and _header[1] == b"marshal":
+        _version = "%d.%d" % sys.version_info[:2]
+        if _header[2].decode() != _version:
+            print("__SANDBOX_ERROR__", file=sys.stderr)
+            print("Bytecode built for Python %s, sandbox runs %s" % (_header[2].decode(), _version), file=sys.stderr)
+            sys.exit(1)
+        _code = marshal.loads(_payload)
+    else:
+        _code = _payload.decode("utf-8")
+
+try:
+    if isinstance(_code, str):
+        _code = compile(_code, "<sandbox>", "exec")
+    _locals = {}
+    exec(_code, _locals)
+    _result = _locals.get("_result")
+
+    print("__SANDBOX_SUCCESS__")
+    if _result is not None:
+        print("__RESULT_START__")
+        print(json.dumps(_result, default=str))
+        print("__RESULT_END__")
+
+except Exception:
+    print("__SANDBOX_ERROR__", file=sys.stderr)
+    traceback.print_exc(file=sys.stderr)
+    sys.exit(1)
+"""
+
+_DANGEROUS_PATTERNS = (
+    "subprocess",
+    "os.system",
+    "eval(",
+    "exec(",
+    "__import__",
+    "importlib",
+    "open(",
+    "file(",
+)
+_NETWORK_PATTERNS = (
+    "socket",
+    "urllib",
+    "requests",
+    "http.client",
+    "ftplib",
+)
+
 
 @dataclass
 class SandboxConfig:
@@ -22,6 +98,8 @@ class SandboxConfig:
 
     Attributes:
         image: Docker image to use for execution.
+        image_pull_policy: Kubernetes pull policy for the image. Set to
+            "Always" when using mutable tags.
         timeout_seconds: Maximum execution time.
         memory_limit_mb: Memory limit in megabytes.
         cpu_limit: CPU limit (e.g., "0.5" for half a core).
@@ -32,9 +110,13 @@ class SandboxConfig:
         max_output_size_kb: Maximum output size in kilobytes.
         working_directory: Working directory inside container.
         environment: Environment variables to set.
+        precompile: Compile code to bytecode on the client and send it
+            marshalled where the backend streams code over stdin. The
+            image must run the same Python major.minor as the client.
     """
 
     image: str = "python:3.11-slim"
+    image_pull_policy: str = "IfNotPresent"
     timeout_seconds: int = 30
     memory_limit_mb: int = 256
     cpu_limit: str = "0.5"
@@ -51,6 +133,7 @@ class SandboxConfig:
     max_output_size_kb: int = 100
     working_directory: str = "/workspace"
     environment: Dict[str, str] = field(default_factory=dict)
+    precompile: bool = False
 
 
 @dataclass
@@ -67,7 +150,7 @@ class SandboxResult:
         error_message: Error message if execution failed.
         truncated: Whether output was truncated due to size limits.
         code_hash: SHA256 hash of executed code (for audit).
-        timestamp: When execution occurred.
+        timestamp_ns: When execution occurred, in nanoseconds since the epoch.
     """
 
     success: bool
@@ -79,7 +162,12 @@ class SandboxResult:
     error_message: Optional[str] = None
     truncated: bool = False
     code_hash: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """When execution occurred, as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def to_audit_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for audit logging."""
@@ -96,6 +184,83 @@ class SandboxResult:
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _code_hash_cached(code: str) -> str:
+    """Compute the SHA256 audit hash of code.
+
+    Args:
+        code: The code to hash.
+
+    Returns:
+        Hex-encoded SHA256 hash.
+    """
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_code_cached(code: str) -> Optional[bytes]:
+    """Compile code and marshal the resulting code object.
+
+    Args:
+        code: The code to compile.
+
+    Returns:
+        Marshalled bytecode, or None if the code does not compile (the
+        sandbox then reports the error from source).
+    """
+    try:
+        return marshal.dumps(compile(code, "<sandbox>", "exec", dont_inherit=True))
+    except (SyntaxError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _validate_code_cached(
+    code: str,
+    network_enabled: bool,
+    allowed_imports: frozenset[str],
+) -> Optional[str]:
+    """Validate code against blocked patterns and the import allowlist.
+
+    Args:
+        code: The code to validate.
+        network_enabled: Whether network modules are permitted.
+        allowed_imports: Whitelist of top-level modules (empty allows all).
+
+    Returns:
+        Error message if validation fails, None if valid.
+    """
+    patterns = _DANGEROUS_PATTERNS if network_enabled else _DANGEROUS_PATTERNS + _NETWORK_PATTERNS
+
+    code_lower = code.lower()
+    for pattern in patterns:
+        if pattern in code_lower:
+            return f"Blocked pattern detected: {pattern}"
+
+    # Validate imports if allowlist is specified
+    if not allowed_imports:
+        return None
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return f"Syntax error in code: {e}"
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                module = alias.name.split(".")[0]
+                if module not in allowed_imports:
+                    return f"Import not allowed: {module}"
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                module = node.module.split(".")[0]
+                if module not in allowed_imports:
+                    return f"Import not allowed: {module}"
+
+    return None
+
+
 class SandboxBase(ABC):
     """Abstract base class for code execution sandboxes.
 
@@ -113,6 +278,11 @@ class SandboxBase(ABC):
             config: Sandbox configuration. Uses defaults if not provided.
         """
         self.config = config or SandboxConfig()
+        self._max_output_size = self.config.max_output_size_kb * 1024
+        self._validation_key = (
+            self.config.network_enabled,
+            frozenset(self.config.allowed_imports),
+        )
 
     @abstractmethod
     async def execute(
@@ -147,58 +317,16 @@ class SandboxBase(ABC):
     def _validate_code(self, code: str) -> Optional[str]:
         """Validate code before execution.
 
+        Verdicts are memoized per (code, configuration) so retries and
+        repeated snippets skip the pattern scan and AST walk.
+
         Args:
             code: The code to validate.
 
         Returns:
             Error message if validation fails, None if valid.
         """
-        # Check for dangerous patterns
-        dangerous_patterns = [
-            "subprocess",
-            "os.system",
-            "eval(",
-            "exec(",
-            "__import__",
-            "importlib",
-            "open(",
-            "file(",
-        ]
-
-        if not self.config.network_enabled:
-            dangerous_patterns.extend([
-                "socket",
-                "urllib",
-                "requests",
-                "http.client",
-                "ftplib",
-            ])
-
-        code_lower = code.lower()
-        for pattern in dangerous_patterns:
-            if pattern.lower() in code_lower:
-                return f"Blocked pattern detected: {pattern}"
-
-        # Validate imports if allowlist is specified
-        if self.config.allowed_imports:
-            import ast
-            try:
-                tree = ast.parse(code)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            module = alias.name.split(".")[0]
-                            if module not in self.config.allowed_imports:
-                                return f"Import not allowed: {module}"
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            module = node.module.split(".")[0]
-                            if module not in self.config.allowed_imports:
-                                return f"Import not allowed: {module}"
-            except SyntaxError as e:
-                return f"Syntax error in code: {e}"
-
-        return None
+        return _validate_code_cached(code, *self._validation_key)
 
     def _compute_code_hash(self, code: str) -> str:
         """Compute SHA256 hash of code for audit.
@@ -209,19 +337,69 @@ class SandboxBase(ABC):
         Returns:
             Hex-encoded SHA256 hash.
         """
-        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+        return _code_hash_cached(code)
+
+    def _frame_stdin_payload(self, code: str) -> bytes:
+        """Frame code for the stdin mode of ``SANDBOX_RUNNER``.
 
-    def _truncate_output(self, output: str) -> tuple[str, bool]:
+        Args:
+            code: The code to execute.
+
+        Returns:
+            Header line followed by the source, or by cached marshalled
+            bytecode when ``config.precompile`` is set.
+        """
+        bytecode = _compile_code_cached(code) if self.config.precompile else None
+        if bytecode is not None:
+            version = "%d.%d" % sys.version_info[:2]
+            return f"{len(bytecode)} marshal {version}\n".encode() + bytecode
+        payload = code.encode("utf-8")
+        return f"{len(payload)}\n".encode() + payload
+
+    def _truncate_output(self, output: AnyStr) -> tuple[AnyStr, bool]:
         """Truncate output if it exceeds the size limit.
 
+        Raw ``bytes`` output is sliced through a ``memoryview`` so the retained
+        portion is copied only once, and returned as-is when no truncation is
+        needed. Callers should decode after truncating.
+
         Args:
-            output: The output string to potentially truncate.
+            output: The output string or bytes to potentially truncate.
 
         Returns:
             Tuple of (possibly truncated output, whether truncation occurred).
         """
-        max_chars = self.config.max_output_size_kb * 1024
-        if len(output) > max_chars:
-            return output[:max_chars] + "\n... [OUTPUT TRUNCATED]", True
-        return output, False
+        max_size = self._max_output_size
+        if len(output) <= max_size:
+            return output, False
+        if isinstance(output, bytes):
+            return b"".join((memoryview(output)[:max_size], _TRUNCATION_SUFFIX_BYTES)), True
+        return output[:max_size] + _TRUNCATION_SUFFIX, True
+
+    def _parse_output(self, stdout: bytes) -> tuple[str, Optional[str], bool]:
+        """Split wrapper markers out of captured stdout.
 
+        Markers are ASCII, so the search runs on the raw log bytes with a
+        ``bytes.partition`` chain; only the slices that survive are decoded.
+
+        Args:
+            stdout: Raw stdout bytes from the sandboxed process.
+
+        Returns:
+            Tuple of (decoded stdout without markers, return value if
+            present, whether the success marker was found).
+        """
+        head, success_marker, after = stdout.partition(_SUCCESS_MARKER)
+        mid, result_start, rest = after.partition(_RESULT_START_MARKER)
+
+        return_value = None
+        tail = rest
+        if result_start:
+            result_bytes, result_end, tail = rest.partition(_RESULT_END_MARKER)
+            if result_end:
+                return_value = result_bytes.strip().decode("utf-8", errors="replace")
+            else:
+                tail = result_bytes
+
+        cleaned = b"".join((head, mid, tail)).strip().decode("utf-8", errors="replace")
+        return cleaned, return_value, bool(success_marker)
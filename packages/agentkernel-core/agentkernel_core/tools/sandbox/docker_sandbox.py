@@ -7,6 +7,7 @@ executing untrusted code with resource limits and isolation.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import tempfile
@@ -14,6 +15,7 @@ import time
 from typing import Any, Optional
 
 from agentkernel_core.tools.sandbox.base import (
+    SANDBOX_RUNNER,
     SandboxBase,
     SandboxConfig,
     SandboxResult,
@@ -43,6 +45,7 @@ class DockerSandbox(SandboxBase):
         """
         super().__init__(config)
         self._docker_client: Optional[Any] = None
+        self._pending_removes: set[asyncio.Future[Any]] = set()
 
     async def _get_client(self) -> Any:
         """Get or create Docker client.
@@ -124,54 +127,24 @@ class DockerSandbox(SandboxBase):
                 code_hash=code_hash,
             )
 
-        # Create wrapper script that captures output
-        wrapper_script = f'''
-import sys
-import json
-import traceback
-
-try:
-    # Redirect to capture output
-    _result = None
-    _locals = {{}}
-    
-    exec("""
-{code}
-""", _locals)
-    
-    # Try to get the last expression result
-    if "_result" in _locals:
-        _result = _locals["_result"]
-    
-    print("__SANDBOX_SUCCESS__")
-    if _result is not None:
-        print("__RESULT_START__")
-        print(json.dumps(_result, default=str))
-        print("__RESULT_END__")
-
-except Exception as e:
-    print("__SANDBOX_ERROR__", file=sys.stderr)
-    traceback.print_exc(file=sys.stderr)
-    sys.exit(1)
-'''
-
-        # Write script to temp file
+        # Write the raw code to a temp file; the fixed runner executes it
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".py",
             delete=False,
+            encoding="utf-8",
         ) as f:
-            f.write(wrapper_script)
+            f.write(code)
             script_path = f.name
 
         try:
             # Build container configuration
             container_config = {
                 "image": self.config.image,
-                "command": ["python", "/sandbox/script.py"],
+                "command": ["python", "-c", SANDBOX_RUNNER, "/sandbox/code.py"],
                 "volumes": {
                     script_path: {
-                        "bind": "/sandbox/script.py",
+                        "bind": "/sandbox/code.py",
                         "mode": "ro",
                     }
                 },
@@ -191,37 +164,33 @@ except Exception as e:
                 container_config["environment"] = self.config.environment
 
             # Run in thread pool to avoid blocking
-            container = await asyncio.get_event_loop().run_in_executor(
+            loop = asyncio.get_event_loop()
+            container = await loop.run_in_executor(
                 None,
-                lambda: client.containers.run(**container_config),
+                functools.partial(client.containers.run, **container_config),
             )
 
             try:
                 # Wait for container with timeout
-                exit_code = await asyncio.wait_for(
-                    asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: container.wait()["StatusCode"],
-                    ),
+                wait_result = await asyncio.wait_for(
+                    loop.run_in_executor(None, container.wait),
                     timeout=self.config.timeout_seconds,
                 )
+                exit_code = wait_result["StatusCode"]
 
-                # Get logs
-                stdout = await asyncio.get_event_loop().run_in_executor(
+                # Get logs (kept as bytes until truncated)
+                stdout_bytes = await loop.run_in_executor(
                     None,
-                    lambda: container.logs(stdout=True, stderr=False).decode("utf-8"),
+                    functools.partial(container.logs, stdout=True, stderr=False),
                 )
-                stderr = await asyncio.get_event_loop().run_in_executor(
+                stderr_bytes = await loop.run_in_executor(
                     None,
-                    lambda: container.logs(stdout=False, stderr=True).decode("utf-8"),
+                    functools.partial(container.logs, stdout=False, stderr=True),
                 )
 
             except asyncio.TimeoutError:
                 # Kill container on timeout
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    container.kill,
-                )
+                await loop.run_in_executor(None, container.kill)
                 execution_time = (time.perf_counter() - start_time) * 1000
                 return SandboxResult(
                     success=False,
@@ -230,11 +199,8 @@ except Exception as e:
                     code_hash=code_hash,
                 )
             finally:
-                # Remove container
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: container.remove(force=True),
-                )
+                # Remove container off the critical path; cleanup() awaits it
+                self._schedule_remove(container)
 
         finally:
             # Clean up temp file
@@ -243,26 +209,13 @@ except Exception as e:
         execution_time = (time.perf_counter() - start_time) * 1000
 
         # Parse output
-        stdout, stdout_truncated = self._truncate_output(stdout)
-        stderr, stderr_truncated = self._truncate_output(stderr)
-
-        # Check for success marker
-        success = "__SANDBOX_SUCCESS__" in stdout and exit_code == 0
-
-        # Extract return value if present
-        return_value = None
-        if "__RESULT_START__" in stdout and "__RESULT_END__" in stdout:
-            try:
-                start_marker = stdout.index("__RESULT_START__") + len("__RESULT_START__")
-                end_marker = stdout.index("__RESULT_END__")
-                return_value = stdout[start_marker:end_marker].strip()
-            except (ValueError, IndexError):
-                pass
+        stdout_bytes, stdout_truncated = self._truncate_output(stdout_bytes)
+        stderr_bytes, stderr_truncated = self._truncate_output(stderr_bytes)
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-        # Clean up stdout markers
-        for marker in ["__SANDBOX_SUCCESS__", "__SANDBOX_ERROR__", "__RESULT_START__", "__RESULT_END__"]:
-            stdout = stdout.replace(marker, "")
-        stdout = stdout.strip()
+        # Split out the success marker and return value in one pass
+        stdout, return_value, has_success_marker = self._parse_output(stdout_bytes)
+        success = has_success_marker and exit_code == 0
 
         return SandboxResult(
             success=success,
@@ -276,8 +229,29 @@ except Exception as e:
             code_hash=code_hash,
         )
 
+    def _schedule_remove(self, container: Any) -> None:
+        """Remove a finished container in the background.
+
+        Args:
+            container: The container to force-remove.
+        """
+        future = asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(container.remove, force=True),
+        )
+        self._pending_removes.add(future)
+        future.add_done_callback(self._on_remove_done)
+
+    def _on_remove_done(self, future: asyncio.Future[Any]) -> None:
+        """Forget a completed removal and log any failure."""
+        self._pending_removes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Failed to remove container: %s", future.exception())
+
     async def cleanup(self) -> None:
         """Clean up Docker resources."""
+        if self._pending_removes:
+            await asyncio.gather(*self._pending_removes, return_exceptions=True)
         if self._docker_client:
             self._docker_client.close()
             self._docker_client = None
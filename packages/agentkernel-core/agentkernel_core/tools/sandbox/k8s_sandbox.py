@@ -7,12 +7,14 @@ executing untrusted code with enterprise-grade isolation.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
 import uuid
 from typing import Any, Dict, Optional
 
 from agentkernel_core.tools.sandbox.base import (
+    SANDBOX_RUNNER,
     SandboxBase,
     SandboxConfig,
     SandboxResult,
@@ -20,6 +22,43 @@ from agentkernel_core.tools.sandbox.base import (
 
 logger = logging.getLogger(__name__)
 
+# Shared (ApiClient, CoreV1Api, BatchV1Api), so all sandboxes reuse one connection pool.
+# Kept per event loop: the aiohttp session and the lock only work on the loop they were used on.
+_CLIENTS: Dict[asyncio.AbstractEventLoop, tuple[Any, Any, Any]] = {}
+_CLIENTS_LOCKS: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+_CONNECTION_POOL_MAXSIZE = 50
+
+# Idle pool pods just stay alive until code is exec'd into them
+_IDLE_COMMAND = ["python", "-c", "import signal; signal.pause()"]
+_POOL_POD_STARTUP_TIMEOUT = 120
+# Kubernetes kills pool pods after this long, so a crashed owner cannot leak them forever.
+# Pods too close to the deadline to finish an execution are retired instead of handed out.
+_POOL_POD_MAX_LIFETIME = 3600
+
+# Job code is mounted from a ConfigMap at this path
+_SCRIPT_MOUNT_PATH = "/opt/run"
+
+# Finished Jobs are reclaimed by the TTL controller; ConfigMaps by the reaper.
+# The TTL must leave time to read the pod logs after completion.
+_JOB_TTL_SECONDS = 60
+_REAP_BATCH_SIZE = 50
+
+# Channels of the v4.channel.k8s.io exec protocol
+_STDIN_CHANNEL = 0
+_STDOUT_CHANNEL = 1
+_STDERR_CHANNEL = 2
+_ERROR_CHANNEL = 3
+
+
+def _forget_closed_loops() -> None:
+    """Drop the shared clients and locks of event loops that have been closed.
+
+    Their sessions cannot be closed from another loop, so they are only released.
+    """
+    for loop in [loop for loop in _CLIENTS_LOCKS if loop.is_closed()]:
+        del _CLIENTS_LOCKS[loop]
+        _CLIENTS.pop(loop, None)
+
 
 class K8sSandbox(SandboxBase):
     """Kubernetes-based sandbox for secure code execution.
@@ -29,6 +68,7 @@ class K8sSandbox(SandboxBase):
     - Network policies
     - Pod security standards
     - Ephemeral pods (auto-cleanup)
+    - Optional warm pool of pre-scheduled pods
     - Audit logging
 
     Requires kubernetes client and cluster access.
@@ -39,6 +79,8 @@ class K8sSandbox(SandboxBase):
         config: Optional[SandboxConfig] = None,
         namespace: str = "agentkernel-sandbox",
         service_account: str = "sandbox-runner",
+        pool_size: int = 0,
+        max_concurrent: int = 16,
     ) -> None:
         """Initialize the Kubernetes sandbox.
 
@@ -46,42 +88,61 @@ class K8sSandbox(SandboxBase):
             config: Sandbox configuration.
             namespace: Kubernetes namespace for sandbox pods.
             service_account: Service account for pods.
+            pool_size: Number of idle pods to keep warm. When 0, each
+                execution runs as its own Job.
+            max_concurrent: Maximum executions in flight against the
+                cluster at once; further calls wait for a free slot.
         """
         super().__init__(config)
         self.namespace = namespace
         self.service_account = service_account
-        self._core_v1: Optional[Any] = None
-        self._batch_v1: Optional[Any] = None
+        self.pool_size = pool_size
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._pool: Optional[SandboxPool] = None
+        self._reap_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._reaper: Optional[asyncio.Task[None]] = None
 
     async def _get_clients(self) -> tuple[Any, Any]:
-        """Get or create Kubernetes clients.
+        """Get or create the Kubernetes clients shared by all sandboxes on the running loop.
 
         Returns:
             Tuple of (CoreV1Api, BatchV1Api) clients.
 
         Raises:
-            ImportError: If kubernetes package is not installed.
+            ImportError: If kubernetes_asyncio package is not installed.
             RuntimeError: If cluster is not accessible.
         """
-        if self._core_v1 is None or self._batch_v1 is None:
-            try:
-                from kubernetes import client, config as k8s_config
-
-                # Try in-cluster config first, then local kubeconfig
-                try:
-                    k8s_config.load_incluster_config()
-                except k8s_config.ConfigException:
-                    k8s_config.load_kube_config()
-
-                self._core_v1 = client.CoreV1Api()
-                self._batch_v1 = client.BatchV1Api()
-
-            except ImportError:
-                raise ImportError("kubernetes package is required. Install with: pip install kubernetes")
-            except Exception as e:
-                raise RuntimeError(f"Kubernetes cluster not accessible: {e}")
-
-        return self._core_v1, self._batch_v1
+        loop = asyncio.get_running_loop()
+        clients = _CLIENTS.get(loop)
+        if clients is None:
+            _forget_closed_loops()
+            async with _CLIENTS_LOCKS.setdefault(loop, asyncio.Lock()):
+                clients = _CLIENTS.get(loop)
+                if clients is None:
+                    try:
+                        from kubernetes_asyncio import client, config as k8s_config
+
+                        # Try in-cluster config first, then local kubeconfig
+                        try:
+                            k8s_config.load_incluster_config()
+                        except k8s_config.ConfigException:
+                            await k8s_config.load_kube_config()
+
+                        configuration = client.Configuration.get_default_copy()
+                        configuration.connection_pool_maxsize = _CONNECTION_POOL_MAXSIZE
+                        api_client = client.ApiClient(configuration)
+                        clients = (api_client, client.CoreV1Api(api_client), client.BatchV1Api(api_client))
+                        _CLIENTS[loop] = clients
+
+                    except ImportError:
+                        raise ImportError(
+                            "kubernetes_asyncio package is required. Install with: pip install kubernetes_asyncio"
+                        )
+                    except Exception as e:
+                        raise RuntimeError(f"Kubernetes cluster not accessible: {e}")
+
+        _, core_v1, batch_v1 = clients
+        return core_v1, batch_v1
 
     async def is_available(self) -> bool:
         """Check if Kubernetes cluster is available.
@@ -92,10 +153,7 @@ class K8sSandbox(SandboxBase):
         try:
             core_v1, _ = await self._get_clients()
             # Try to list namespaces to verify access
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: core_v1.list_namespace(limit=1),
-            )
+            await core_v1.list_namespace(limit=1)
             return True
         except Exception as e:
             logger.warning("Kubernetes not available: %s", e)
@@ -117,8 +175,6 @@ class K8sSandbox(SandboxBase):
         Returns:
             SandboxResult with execution outcome.
         """
-        from kubernetes import client
-
         start_time = time.perf_counter()
         code_hash = self._compute_code_hash(code)
 
@@ -147,39 +203,148 @@ class K8sSandbox(SandboxBase):
                 code_hash=code_hash,
             )
 
+        # Cap in-flight Jobs/execs so bursts don't overload the API server
+        try:
+            async with self._slots:
+                if self.pool_size > 0:
+                    stdout_bytes, stderr_bytes, exit_code = await self._execute_pooled(code)
+                else:
+                    stdout_bytes, stderr_bytes, exit_code = await self._execute_job(core_v1, batch_v1, code, kwargs)
+        except Exception as e:
+            logger.warning("Sandbox execution failed: %s", e)
+            return SandboxResult(
+                success=False,
+                error_message=f"Execution failed: {e}",
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                code_hash=code_hash,
+            )
+        completed = exit_code is not None
+
+        execution_time = (time.perf_counter() - start_time) * 1000
+
+        if not completed:
+            return SandboxResult(
+                success=False,
+                error_message=f"Execution timed out after {self.config.timeout_seconds}s",
+                execution_time_ms=execution_time,
+                code_hash=code_hash,
+            )
+
+        # Parse output (kept as bytes until the markers are split out)
+        stdout_bytes, stdout_truncated = self._truncate_output(stdout_bytes)
+        stderr_bytes, stderr_truncated = self._truncate_output(stderr_bytes)
+        stderr = stderr_bytes.decode("utf-8", errors="replace")
+
+        # Split out the success marker and return value in one pass
+        stdout, return_value, has_success_marker = self._parse_output(stdout_bytes)
+        success = has_success_marker and exit_code == 0
+
+        return SandboxResult(
+            success=success,
+            stdout=stdout,
+            stderr=stderr,
+            return_value=return_value,
+            execution_time_ms=execution_time,
+            exit_code=exit_code,
+            error_message=None if success else f"Execution failed with exit code {exit_code}",
+            truncated=stdout_truncated or stderr_truncated,
+            code_hash=code_hash,
+        )
+
+    def _build_pod_spec(
+        self,
+        command: list[str],
+        volume_mounts: Optional[list[Any]] = None,
+        **overrides: Any,
+    ) -> Any:
+        """Build the locked-down Pod spec shared by Jobs and pool pods.
+
+        Args:
+            command: Command for the sandbox container.
+            volume_mounts: Volume mounts for the sandbox container.
+            **overrides: Extra ``V1PodSpec`` fields.
+
+        Returns:
+            A ``V1PodSpec`` instance.
+        """
+        from kubernetes_asyncio import client
+
+        return client.V1PodSpec(
+            service_account_name=self.service_account,
+            restart_policy="Never",
+            automount_service_account_token=False,
+            security_context=client.V1PodSecurityContext(
+                run_as_non_root=True,
+                run_as_user=1000,
+                run_as_group=1000,
+                fs_group=1000,
+                seccomp_profile=client.V1SeccompProfile(
+                    type="RuntimeDefault",
+                ),
+            ),
+            containers=[
+                client.V1Container(
+                    name="sandbox",
+                    image=self.config.image,
+                    image_pull_policy=self.config.image_pull_policy,
+                    command=command,
+                    volume_mounts=volume_mounts,
+                    resources=client.V1ResourceRequirements(
+                        limits={
+                            "cpu": self.config.cpu_limit,
+                            "memory": f"{self.config.memory_limit_mb}Mi",
+                        },
+                        requests={
+                            "cpu": "100m",
+                            "memory": "64Mi",
+                        },
+                    ),
+                    security_context=client.V1SecurityContext(
+                        allow_privilege_escalation=False,
+                        read_only_root_filesystem=self.config.read_only_fs,
+                        capabilities=client.V1Capabilities(
+                            drop=["ALL"],
+                        ),
+                    ),
+                ),
+            ],
+            **overrides,
+        )
+
+    async def _execute_job(
+        self,
+        core_v1: Any,
+        batch_v1: Any,
+        code: str,
+        kwargs: Dict[str, Any],
+    ) -> tuple[bytes, bytes, Optional[int]]:
+        """Run code as a one-off Job.
+
+        Args:
+            core_v1: CoreV1Api client.
+            batch_v1: BatchV1Api client.
+            code: The code to execute.
+            kwargs: Execution parameters passed to ``execute``.
+
+        Returns:
+            Tuple of (raw stdout, raw stderr, exit code or None on timeout).
+        """
+        from kubernetes_asyncio import client
+
         # Generate unique job name
         job_name = f"sandbox-{uuid.uuid4().hex[:12]}"
 
-        # Create wrapper script
-        import base64
-        wrapper_script = f'''
-import sys
-import json
-import traceback
-
-try:
-    _result = None
-    _locals = {{}}
-    
-    exec("""
-{code}
-""", _locals)
-    
-    if "_result" in _locals:
-        _result = _locals["_result"]
-    
-    print("__SANDBOX_SUCCESS__")
-    if _result is not None:
-        print("__RESULT_START__")
-        print(json.dumps(_result, default=str))
-        print("__RESULT_END__")
-
-except Exception as e:
-    print("__SANDBOX_ERROR__", file=sys.stderr)
-    traceback.print_exc(file=sys.stderr)
-    sys.exit(1)
-'''
-        encoded_script = base64.b64encode(wrapper_script.encode()).decode()
+        # Ship the raw code through a ConfigMap; the fixed runner executes it
+        config_map = client.V1ConfigMap(
+            api_version="v1",
+            kind="ConfigMap",
+            metadata=client.V1ObjectMeta(
+                name=job_name,
+                namespace=self.namespace,
+                labels={"app": "agentkernel-sandbox"},
+            ),
+            data={"code.py": code},
+        )
 
         # Build Job spec
         job_spec = client.V1Job(
@@ -194,51 +359,26 @@ except Exception as e:
                 },
             ),
             spec=client.V1JobSpec(
-                ttl_seconds_after_finished=60,  # Auto-cleanup
+                ttl_seconds_after_finished=_JOB_TTL_SECONDS,  # Auto-cleanup
                 backoff_limit=0,  # No retries
                 active_deadline_seconds=self.config.timeout_seconds,
                 template=client.V1PodTemplateSpec(
                     metadata=client.V1ObjectMeta(
                         labels={"app": "agentkernel-sandbox"},
                     ),
-                    spec=client.V1PodSpec(
-                        service_account_name=self.service_account,
-                        restart_policy="Never",
-                        automount_service_account_token=False,
-                        security_context=client.V1PodSecurityContext(
-                            run_as_non_root=True,
-                            run_as_user=1000,
-                            run_as_group=1000,
-                            fs_group=1000,
-                            seccomp_profile=client.V1SeccompProfile(
-                                type="RuntimeDefault",
+                    spec=self._build_pod_spec(
+                        ["python", "-c", SANDBOX_RUNNER, f"{_SCRIPT_MOUNT_PATH}/code.py"],
+                        volume_mounts=[
+                            client.V1VolumeMount(
+                                name="script",
+                                mount_path=_SCRIPT_MOUNT_PATH,
+                                read_only=True,
                             ),
-                        ),
-                        containers=[
-                            client.V1Container(
-                                name="sandbox",
-                                image=self.config.image,
-                                command=[
-                                    "sh", "-c",
-                                    f"echo {encoded_script} | base64 -d | python",
-                                ],
-                                resources=client.V1ResourceRequirements(
-                                    limits={
-                                        "cpu": self.config.cpu_limit,
-                                        "memory": f"{self.config.memory_limit_mb}Mi",
-                                    },
-                                    requests={
-                                        "cpu": "100m",
-                                        "memory": "64Mi",
-                                    },
-                                ),
-                                security_context=client.V1SecurityContext(
-                                    allow_privilege_escalation=False,
-                                    read_only_root_filesystem=self.config.read_only_fs,
-                                    capabilities=client.V1Capabilities(
-                                        drop=["ALL"],
-                                    ),
-                                ),
+                        ],
+                        volumes=[
+                            client.V1Volume(
+                                name="script",
+                                config_map=client.V1ConfigMapVolumeSource(name=job_name),
                             ),
                         ],
                     ),
@@ -246,129 +386,394 @@ except Exception as e:
             ),
         )
 
+        stdout = b""
         try:
-            # Create the Job
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: batch_v1.create_namespaced_job(
-                    namespace=self.namespace,
-                    body=job_spec,
-                ),
+            # Create the script ConfigMap and the Job
+            await core_v1.create_namespaced_config_map(
+                namespace=self.namespace,
+                body=config_map,
+            )
+            await batch_v1.create_namespaced_job(
+                namespace=self.namespace,
+                body=job_spec,
             )
 
-            # Wait for completion
-            completed = False
-            pod_name = None
-            exit_code = -1
-
-            for _ in range(self.config.timeout_seconds * 2):  # Poll every 0.5s
-                await asyncio.sleep(0.5)
-
-                # Check job status
-                job = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: batch_v1.read_namespaced_job_status(
-                        name=job_name,
-                        namespace=self.namespace,
+            # Wait for completion via watch streams instead of polling
+            try:
+                exit_code, pod_name = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._await_job_terminal(batch_v1, job_name),
+                        self._await_pod_name(core_v1, job_name),
                     ),
+                    timeout=self.config.timeout_seconds,
                 )
+            except asyncio.TimeoutError:
+                exit_code, pod_name = None, None
 
-                if job.status.succeeded:
-                    completed = True
-                    exit_code = 0
-                    break
-                elif job.status.failed:
-                    completed = True
-                    exit_code = 1
-                    break
-
-                # Get pod name for logs
-                if pod_name is None:
-                    pods = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: core_v1.list_namespaced_pod(
-                            namespace=self.namespace,
-                            label_selector=f"job-name={job_name}",
-                        ),
-                    )
-                    if pods.items:
-                        pod_name = pods.items[0].metadata.name
-
-            # Get logs
-            stdout = ""
-            stderr = ""
+            # Get logs as raw bytes; only the unmarked slices get decoded
             if pod_name:
                 try:
-                    logs = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: core_v1.read_namespaced_pod_log(
-                            name=pod_name,
-                            namespace=self.namespace,
-                        ),
+                    resp = await core_v1.read_namespaced_pod_log(
+                        name=pod_name,
+                        namespace=self.namespace,
+                        _preload_content=False,
                     )
-                    stdout = logs
+                    stdout = await resp.read()
                 except Exception as e:
                     logger.warning("Failed to get pod logs: %s", e)
 
         finally:
-            # Clean up job (TTL will handle it, but let's be explicit)
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: batch_v1.delete_namespaced_job(
-                        name=job_name,
-                        namespace=self.namespace,
-                        propagation_policy="Background",
-                    ),
-                )
-            except Exception as e:
-                logger.warning("Failed to delete job %s: %s", job_name, e)
+            # The TTL controller reclaims the Job (active_deadline_seconds
+            # guarantees it finishes); the ConfigMap is reaped in batches.
+            self._schedule_reap(job_name)
 
-        execution_time = (time.perf_counter() - start_time) * 1000
+        return stdout, b"", exit_code
 
-        if not completed:
-            return SandboxResult(
-                success=False,
-                error_message=f"Execution timed out after {self.config.timeout_seconds}s",
-                execution_time_ms=execution_time,
-                code_hash=code_hash,
+    def _schedule_reap(self, config_map_name: str) -> None:
+        """Queue a script ConfigMap for background deletion.
+
+        Args:
+            config_map_name: Name of the ConfigMap to delete.
+        """
+        self._reap_queue.put_nowait(config_map_name)
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.ensure_future(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """Delete queued ConfigMaps, up to ``_REAP_BATCH_SIZE`` at a time."""
+        core_v1, _ = await self._get_clients()
+        while True:
+            names = [await self._reap_queue.get()]
+            while len(names) < _REAP_BATCH_SIZE and not self._reap_queue.empty():
+                names.append(self._reap_queue.get_nowait())
+
+            results = await asyncio.gather(
+                *(
+                    core_v1.delete_namespaced_config_map(name=name, namespace=self.namespace)
+                    for name in names
+                ),
+                return_exceptions=True,
             )
+            for name, result in zip(names, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to delete config map %s: %s", name, result)
+                self._reap_queue.task_done()
 
-        # Parse output
-        stdout, stdout_truncated = self._truncate_output(stdout)
+    async def _execute_pooled(self, code: str) -> tuple[bytes, bytes, Optional[int]]:
+        """Run code in a warm pool pod.
 
-        # Check for success marker
-        success = "__SANDBOX_SUCCESS__" in stdout and exit_code == 0
+        Each pod is used for a single execution and then replaced, so no
+        state leaks between runs.
 
-        # Extract return value if present
-        return_value = None
-        if "__RESULT_START__" in stdout and "__RESULT_END__" in stdout:
-            try:
-                start_marker = stdout.index("__RESULT_START__") + len("__RESULT_START__")
-                end_marker = stdout.index("__RESULT_END__")
-                return_value = stdout[start_marker:end_marker].strip()
-            except (ValueError, IndexError):
-                pass
+        Args:
+            code: The code to execute.
 
-        # Clean up stdout markers
-        for marker in ["__SANDBOX_SUCCESS__", "__SANDBOX_ERROR__", "__RESULT_START__", "__RESULT_END__"]:
-            stdout = stdout.replace(marker, "")
-        stdout = stdout.strip()
+        Returns:
+            Tuple of (raw stdout, raw stderr, exit code or None on timeout).
+        """
+        if self._pool is None:
+            self._pool = SandboxPool(self, self.pool_size)
+            self._pool.start()
+        pool = self._pool
+
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.config.timeout_seconds
+        pod_name = None
+        try:
+            pod_name = await asyncio.wait_for(pool.acquire(), timeout=self.config.timeout_seconds)
+            return await asyncio.wait_for(
+                pool.exec_code(pod_name, code),
+                timeout=max(0.0, deadline - loop.time()),
+            )
+        except asyncio.TimeoutError:
+            return b"", b"", None
+        finally:
+            if pod_name is not None:
+                pool.retire(pod_name)
 
-        return SandboxResult(
-            success=success,
-            stdout=stdout,
-            stderr=stderr,
-            return_value=return_value,
-            execution_time_ms=execution_time,
-            exit_code=exit_code,
-            error_message=None if success else f"Execution failed with exit code {exit_code}",
-            truncated=stdout_truncated,
-            code_hash=code_hash,
-        )
+    async def _await_job_terminal(self, batch_v1: Any, job_name: str) -> Optional[int]:
+        """Wait until the Job succeeds or fails, using a watch stream.
+
+        Args:
+            batch_v1: BatchV1Api client.
+            job_name: Name of the Job to watch.
+
+        Returns:
+            0 if the Job succeeded, 1 if it failed, None if the watch timed out.
+        """
+        from kubernetes_asyncio import watch
+
+        async with watch.Watch() as w:
+            async for event in w.stream(
+                batch_v1.list_namespaced_job,
+                namespace=self.namespace,
+                field_selector=f"metadata.name={job_name}",
+                timeout_seconds=self.config.timeout_seconds,
+            ):
+                status = event["object"].status
+                if status.succeeded:
+                    return 0
+                if status.failed:
+                    return 1
+        return None
+
+    async def _await_pod_name(self, core_v1: Any, job_name: str) -> Optional[str]:
+        """Wait until the Job's Pod appears, using a watch stream.
+
+        Args:
+            core_v1: CoreV1Api client.
+            job_name: Name of the Job owning the Pod.
+
+        Returns:
+            Name of the first Pod created for the Job, or None on timeout.
+        """
+        from kubernetes_asyncio import watch
+
+        async with watch.Watch() as w:
+            async for event in w.stream(
+                core_v1.list_namespaced_pod,
+                namespace=self.namespace,
+                label_selector=f"job-name={job_name}",
+                timeout_seconds=self.config.timeout_seconds,
+            ):
+                return event["object"].metadata.name
+        return None
 
     async def cleanup(self) -> None:
         """Clean up Kubernetes resources."""
-        # Nothing to clean up - pods are ephemeral
-        pass
+        # Job pods are ephemeral and clients are shared; only the pool is owned
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+        # Let pending ConfigMap deletions finish before stopping the reaper
+        if self._reaper is not None:
+            if not self._reaper.done():
+                await self._reap_queue.join()
+                self._reaper.cancel()
+                await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+
+    @staticmethod
+    async def close_shared_clients() -> None:
+        """Close the API client shared by the K8sSandbox instances on the running loop."""
+        loop = asyncio.get_running_loop()
+        async with _CLIENTS_LOCKS.setdefault(loop, asyncio.Lock()):
+            clients = _CLIENTS.pop(loop, None)
+            if clients is not None:
+                api_client, _, _ = clients
+                await api_client.close()
+
+
+class SandboxPool:
+    """Pool of idle sandbox Pods that receive code over exec.
+
+    Pods are created ahead of time so executions skip Job creation,
+    scheduling and image pulls. Every pod runs at most one execution;
+    a replacement is warmed in the background when it is retired.
+    """
+
+    def __init__(self, sandbox: K8sSandbox, size: int) -> None:
+        """Initialize the pool.
+
+        Args:
+            sandbox: The sandbox whose configuration the pods use.
+            size: Number of idle pods to keep warm.
+        """
+        self._sandbox = sandbox
+        self.size = size
+        self._ready: asyncio.Queue[tuple[str, float]] = asyncio.Queue()
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._delete_tasks: set[asyncio.Task[Any]] = set()
+        self._ws_client: Optional[Any] = None
 
+    def start(self) -> None:
+        """Begin warming pods in the background."""
+        from kubernetes_asyncio import client
+        from kubernetes_asyncio.stream import WsApiClient
+
+        self._ws_client = WsApiClient(configuration=client.Configuration.get_default_copy())
+        for _ in range(self.size):
+            self._spawn(self._warm_one())
+
+    async def acquire(self) -> str:
+        """Wait for an idle pod.
+
+        Returns:
+            Name of a running pod reserved for the caller.
+        """
+        while True:
+            pod_name, expires_at = await self._ready.get()
+            if time.monotonic() + self._sandbox.config.timeout_seconds < expires_at:
+                return pod_name
+            self.retire(pod_name)
+
+    def retire(self, pod_name: str) -> None:
+        """Delete a used pod and warm a replacement.
+
+        Args:
+            pod_name: Name of the pod returned by ``acquire``.
+        """
+        self._spawn(self._delete_pod(pod_name), self._delete_tasks)
+        self._spawn(self._warm_one())
+
+    async def exec_code(self, pod_name: str, code: str) -> tuple[bytes, bytes, int]:
+        """Stream code into a pod's Python interpreter over exec.
+
+        Args:
+            pod_name: Name of an acquired pod.
+            code: The code to execute.
+
+        Returns:
+            Tuple of (raw stdout, raw stderr, exit code).
+        """
+        from kubernetes_asyncio import client
+
+        core_ws = client.CoreV1Api(api_client=self._ws_client)
+        ws = await core_ws.connect_get_namespaced_pod_exec(
+            pod_name,
+            self._sandbox.namespace,
+            command=["python", "-u", "-c", SANDBOX_RUNNER],
+            stdin=True,
+            stdout=True,
+            stderr=True,
+            tty=False,
+            _preload_content=False,
+        )
+
+        payload = self._sandbox._frame_stdin_payload(code)
+        stdout_parts: list[bytes] = []
+        stderr_parts: list[bytes] = []
+        status: Dict[str, Any] = {}
+        # With _preload_content=False the client returns the ws_connect context manager
+        async with ws as websocket:
+            await websocket.send_bytes(bytes([_STDIN_CHANNEL]) + payload)
+            async for msg in websocket:
+                data = msg.data
+                if not isinstance(data, bytes) or not data:
+                    continue
+                channel, body = data[0], data[1:]
+                if channel == _STDOUT_CHANNEL:
+                    stdout_parts.append(body)
+                elif channel == _STDERR_CHANNEL:
+                    stderr_parts.append(body)
+                elif channel == _ERROR_CHANNEL and body:
+                    status = json.loads(body)
+                    break
+
+        return (
+            b"".join(stdout_parts),
+            b"".join(stderr_parts),
+            _exit_code_from_status(status),
+        )
+
+    async def close(self) -> None:
+        """Stop warming and delete all pods owned by the pool.
+
+        Warm-ups are cancelled (they delete their own pod), but pending
+        deletions of retired pods are awaited so no pod is left behind.
+        """
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._delete_tasks, return_exceptions=True)
+
+        idle = []
+        while not self._ready.empty():
+            idle.append(self._ready.get_nowait()[0])
+        await asyncio.gather(*(self._delete_pod(name) for name in idle), return_exceptions=True)
+
+        if self._ws_client is not None:
+            await self._ws_client.close()
+            self._ws_client = None
+
+    def _spawn(self, coro: Any, tasks: Optional[set[asyncio.Task[Any]]] = None) -> None:
+        """Run a coroutine in the background, tracked for ``close``.
+
+        Args:
+            coro: The coroutine to run.
+            tasks: The set tracking it; defaults to the cancellable tasks.
+        """
+        if tasks is None:
+            tasks = self._tasks
+        task = asyncio.ensure_future(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _warm_one(self) -> None:
+        """Create one idle pod and enqueue it once it is running."""
+        from kubernetes_asyncio import client, watch
+
+        sandbox = self._sandbox
+        core_v1, _ = await sandbox._get_clients()
+        pod_name = f"sandbox-pool-{uuid.uuid4().hex[:12]}"
+        lifetime = max(_POOL_POD_MAX_LIFETIME, 2 * sandbox.config.timeout_seconds)
+        pod = client.V1Pod(
+            api_version="v1",
+            kind="Pod",
+            metadata=client.V1ObjectMeta(
+                name=pod_name,
+                namespace=sandbox.namespace,
+                labels={"app": "agentkernel-sandbox", "agentkernel-sandbox-pool": "idle"},
+            ),
+            spec=sandbox._build_pod_spec(
+                _IDLE_COMMAND,
+                termination_grace_period_seconds=0,
+                active_deadline_seconds=lifetime,
+            ),
+        )
+
+        try:
+            expires_at = time.monotonic() + lifetime
+            await core_v1.create_namespaced_pod(namespace=sandbox.namespace, body=pod)
+            async with watch.Watch() as w:
+                async for event in w.stream(
+                    core_v1.list_namespaced_pod,
+                    namespace=sandbox.namespace,
+                    field_selector=f"metadata.name={pod_name}",
+                    timeout_seconds=_POOL_POD_STARTUP_TIMEOUT,
+                ):
+                    phase = event["object"].status.phase
+                    if phase == "Running":
+                        self._ready.put_nowait((pod_name, expires_at))
+                        return
+                    if phase in ("Succeeded", "Failed"):
+                        break
+        except asyncio.CancelledError:
+            await self._delete_pod(pod_name)
+            raise
+        except Exception as e:
+            logger.warning("Failed to warm sandbox pod %s: %s", pod_name, e)
+
+        await self._delete_pod(pod_name)
+
+    async def _delete_pod(self, pod_name: str) -> None:
+        """Delete a pool pod immediately."""
+        core_v1, _ = await self._sandbox._get_clients()
+        try:
+            await core_v1.delete_namespaced_pod(
+                name=pod_name,
+                namespace=self._sandbox.namespace,
+                grace_period_seconds=0,
+            )
+        except Exception as e:
+            logger.warning("Failed to delete sandbox pod %s: %s", pod_name, e)
+
+
+def _exit_code_from_status(status: Dict[str, Any]) -> int:
+    """Extract the process exit code from an exec status message.
+
+    Args:
+        status: Decoded ``v1.Status`` sent on the error channel.
+
+    Returns:
+        0 on success, the reported exit code on failure, or 1 if unknown.
+    """
+    if status.get("status") == "Success":
+        return 0
+    for cause in (status.get("details") or {}).get("causes") or []:
+        if cause.get("reason") == "ExitCode":
+            try:
+                return int(cause.get("message", 1))
+            except ValueError:
+                break
+    return 1
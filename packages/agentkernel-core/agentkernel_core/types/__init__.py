@@ -9,6 +9,7 @@ from agentkernel_core.types.schemas import (
     MemoryRecord,
     MemoryQuery,
     MemoryHit,
+    MemoryHitBatch,
     RelationEdge,
     GraphNode,
     VectorDocument,
@@ -26,6 +27,7 @@ __all__ = [
     "MemoryRecord",
     "MemoryQuery",
     "MemoryHit",
+    "MemoryHitBatch",
     "RelationEdge",
     "GraphNode",
     "VectorDocument",
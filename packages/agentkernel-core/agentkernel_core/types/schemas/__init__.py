@@ -2,7 +2,7 @@
 
 from agentkernel_core.types.schemas.message import Message, MessageContent, MessageKind
 from agentkernel_core.types.schemas.tool import ToolSpec, ToolSafety
-from agentkernel_core.types.schemas.memory import MemoryRecord, MemoryQuery, MemoryHit
+from agentkernel_core.types.schemas.memory import MemoryRecord, MemoryQuery, MemoryHit, MemoryHitBatch
 from agentkernel_core.types.schemas.graph import RelationEdge, GraphNode
 from agentkernel_core.types.schemas.vectordb import (
     VectorDocument,
@@ -23,6 +23,7 @@ __all__ = [
     "MemoryRecord",
     "MemoryQuery",
     "MemoryHit",
+    "MemoryHitBatch",
     # Graph
     "RelationEdge",
     "GraphNode",
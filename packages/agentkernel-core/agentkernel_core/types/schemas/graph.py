@@ -6,13 +6,19 @@ Social Graph memory system to track agent relationships.
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
+# Fraction of the weight replaced by each interaction's sentiment
+_WEIGHT_DECAY = 0.1
+
+
 class RelationType(str, Enum):
     """Types of relationships between agents.
 
@@ -95,17 +101,46 @@ class RelationEdge(BaseModel):
         """Record an interaction and update relationship metrics.
 
         Args:
-            sentiment: Sentiment of the interaction (-1.0 to 1.0).
+            sentiment: Sentiment of the interaction, clipped to [-1.0, 1.0].
         """
+        now = datetime.now()
         self.interaction_count += 1
-        self.last_interaction = datetime.now()
-        self.updated_at = datetime.now()
+        self.last_interaction = now
+        self.updated_at = now
 
         # Gradually adjust weight based on interaction sentiment
-        decay = 0.1
-        self.weight = (1 - decay) * self.weight + decay * sentiment
+        sentiment = max(-1.0, min(1.0, sentiment))
+        self.weight = (1 - _WEIGHT_DECAY) * self.weight + _WEIGHT_DECAY * sentiment
         self.weight = max(-1.0, min(1.0, self.weight))
 
+    def record_interactions_bulk(self, sentiments: Any) -> None:
+        """Record a sequence of interactions in one step.
+
+        Equivalent to calling ``record_interaction`` once per sentiment, in
+        order. Both clip each sentiment to [-1.0, 1.0], which keeps every
+        intermediate weight in range, so the recurrence
+        ``w' = (1 - d) * w + d * s`` can be evaluated in closed form,
+        ``w_K = (1 - d)^K * w_0 + d * sum((1 - d)^(K-1-i) * s_i)``, as a
+        single dot product without a per-step clamp.
+
+        Args:
+            sentiments: Interaction sentiments, oldest first, each clipped to [-1.0, 1.0].
+        """
+        values = np.clip(np.asarray(sentiments, dtype=np.float64).ravel(), -1.0, 1.0)
+        count = values.size
+        if count == 0:
+            return
+
+        keep = 1 - _WEIGHT_DECAY
+        powers = keep ** np.arange(count - 1, -1, -1, dtype=np.float64)
+        final = keep**count * self.weight + _WEIGHT_DECAY * float(powers @ values)
+
+        now = datetime.now()
+        self.interaction_count += count
+        self.last_interaction = now
+        self.updated_at = now
+        self.weight = float(np.clip(final, -1.0, 1.0))
+
     def is_positive(self) -> bool:
         """Check if this is a positive relationship."""
         return self.weight > 0.2
@@ -121,6 +156,11 @@ class RelationEdge(BaseModel):
         return f"{self.source_id} has a {strength} {sentiment} {self.relation_type.value} relationship with {self.target_id}"
 
 
+def _abs_weight(edge: RelationEdge) -> float:
+    """Sort key ranking edges by relationship strength."""
+    return abs(edge.weight)
+
+
 class SocialSubgraph(BaseModel):
     """A subgraph of social relationships centered on an agent.
 
@@ -136,31 +176,44 @@ class SocialSubgraph(BaseModel):
     edges: List[RelationEdge] = Field(default_factory=list)
     depth: int = 1
 
+    def add_edge(self, edge: RelationEdge) -> None:
+        """Append an edge to the subgraph."""
+        self.edges.append(edge)
+
+    def _classify(self) -> Tuple[List[RelationEdge], List[str], List[str]]:
+        """Split edges into (direct, friends, enemies) in a single pass.
+
+        Not cached: edge weights change in place through ``record_interaction``.
+        """
+        center = self.center_agent_id
+        direct: List[RelationEdge] = []
+        friends: List[str] = []
+        enemies: List[str] = []
+        for edge in self.edges:
+            if edge.source_id == center:
+                other_id = edge.target_id
+            elif edge.target_id == center:
+                other_id = edge.source_id
+            else:
+                continue
+            direct.append(edge)
+            if edge.is_positive():
+                friends.append(other_id)
+            elif edge.is_negative():
+                enemies.append(other_id)
+        return direct, friends, enemies
+
     def get_direct_relations(self) -> List[RelationEdge]:
         """Get edges directly connected to the center agent."""
-        return [
-            e
-            for e in self.edges
-            if e.source_id == self.center_agent_id or e.target_id == self.center_agent_id
-        ]
+        return self._classify()[0]
 
     def get_friends(self) -> List[str]:
         """Get IDs of agents with positive relationships."""
-        friends = []
-        for edge in self.get_direct_relations():
-            if edge.is_positive():
-                other_id = edge.target_id if edge.source_id == self.center_agent_id else edge.source_id
-                friends.append(other_id)
-        return friends
+        return self._classify()[1]
 
     def get_enemies(self) -> List[str]:
         """Get IDs of agents with negative relationships."""
-        enemies = []
-        for edge in self.get_direct_relations():
-            if edge.is_negative():
-                other_id = edge.target_id if edge.source_id == self.center_agent_id else edge.source_id
-                enemies.append(other_id)
-        return enemies
+        return self._classify()[2]
 
     def to_summary(self, max_relations: int = 5) -> str:
         """Generate a human-readable summary of the social context.
@@ -171,12 +224,12 @@ class SocialSubgraph(BaseModel):
         Returns:
             Summary text describing the agent's social relationships.
         """
-        direct_edges = self.get_direct_relations()
+        direct_edges = self._classify()[0]
         if not direct_edges:
             return f"{self.center_agent_id} has no known relationships."
 
-        # Sort by absolute weight (strongest first)
-        sorted_edges = sorted(direct_edges, key=lambda e: abs(e.weight), reverse=True)[:max_relations]
+        # Strongest first by absolute weight; O(E log k) instead of a full sort
+        sorted_edges = heapq.nlargest(max_relations, direct_edges, key=_abs_weight)
 
         summaries = [e.to_summary() for e in sorted_edges]
         return "\n".join(summaries)
@@ -6,11 +6,68 @@ used by the Memory Layer for both Vector RAG and Social Graph memory systems.
 
 from __future__ import annotations
 
+import io
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, model_validator
+
+
+def _to_float32_array(value: Any) -> Optional[np.ndarray]:
+    """Coerce a sequence of numbers to a contiguous 1-D float32 array."""
+    if value is None:
+        return None
+    array = np.ascontiguousarray(value, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D vector, got shape {array.shape}")
+    return array
+
+
+def _float32_array_to_list(value: Optional[np.ndarray]) -> Optional[List[float]]:
+    """Serialize a float32 array back to a plain list of floats."""
+    return None if value is None else value.tolist()
+
+
+# Embedding vector stored as contiguous float32 (4 bytes per dimension instead
+# of a boxed Python float); dumps to a plain list.
+NDArrayF32 = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float32_array),
+    PlainSerializer(_float32_array_to_list),
+]
+
+
+class _VectorModel(BaseModel):
+    """Base for models with ``NDArrayF32`` fields.
+
+    Pydantic's ``__eq__`` compares field values with ``==``, which is
+    elementwise (and ambiguous as a bool) for arrays; arrays are compared
+    with ``np.array_equal`` here instead.
+    """
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        if (
+            self.__pydantic_private__ != other.__pydantic_private__
+            or self.__pydantic_extra__ != other.__pydantic_extra__
+            or self.__dict__.keys() != other.__dict__.keys()
+        ):
+            return False
+        for name, value in self.__dict__.items():
+            other_value = other.__dict__[name]
+            if isinstance(value, np.ndarray) or isinstance(other_value, np.ndarray):
+                if not (
+                    isinstance(value, np.ndarray)
+                    and isinstance(other_value, np.ndarray)
+                    and np.array_equal(value, other_value)
+                ):
+                    return False
+            elif value != other_value:
+                return False
+        return True
 
 
 class MemoryType(str, Enum):
@@ -29,7 +86,7 @@ class MemoryType(str, Enum):
     SOCIAL = "social"
 
 
-class MemoryRecord(BaseModel):
+class MemoryRecord(_VectorModel):
     """A single memory record that can be stored and retrieved.
 
     Attributes:
@@ -40,7 +97,8 @@ class MemoryRecord(BaseModel):
         tick: Simulation tick when the memory was created.
         timestamp: Wall-clock time when the memory was created.
         importance: Importance score (0.0 to 1.0).
-        vector: Optional embedding vector for similarity search.
+        vector: Optional float32 embedding vector for similarity search.
+            Test for presence with ``is not None``; an array has no truth value.
         metadata: Additional key-value metadata.
         related_agents: List of agent IDs mentioned/involved in this memory.
         related_memories: List of related memory IDs.
@@ -55,7 +113,7 @@ class MemoryRecord(BaseModel):
     tick: int = 0
     timestamp: datetime = Field(default_factory=datetime.now)
     importance: float = Field(default=0.5, ge=0.0, le=1.0)
-    vector: Optional[List[float]] = None
+    vector: Optional[NDArrayF32] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
     related_agents: List[str] = Field(default_factory=list)
     related_memories: List[str] = Field(default_factory=list)
@@ -68,12 +126,13 @@ class MemoryRecord(BaseModel):
         self.last_accessed = datetime.now()
 
 
-class MemoryQuery(BaseModel):
+class MemoryQuery(_VectorModel):
     """Query specification for memory retrieval.
 
     Attributes:
         query_text: The text query to search for.
-        query_vector: Optional pre-computed query vector.
+        query_vector: Optional pre-computed float32 query vector. Test for
+            presence with ``is not None``; an array has no truth value.
         agent_id: Optional filter by agent ID.
         memory_types: Optional filter by memory types.
         top_k: Maximum number of results to return.
@@ -88,7 +147,7 @@ class MemoryQuery(BaseModel):
     """
 
     query_text: Optional[str] = None
-    query_vector: Optional[List[float]] = None
+    query_vector: Optional[NDArrayF32] = None
     agent_id: Optional[str] = None
     memory_types: Optional[List[MemoryType]] = None
     top_k: int = Field(default=10, ge=1, le=100)
@@ -116,6 +175,130 @@ class MemoryHit(BaseModel):
     explanation: Optional[str] = None
 
 
+class MemoryHitBatch(_VectorModel):
+    """Structure-of-arrays view over a set of memory hits.
+
+    Scores live in one float32 array so thresholding, top-k selection and
+    reranking run as numpy operations instead of per-hit Python loops.
+    Convert back with ``to_hits`` at API boundaries.
+
+    Attributes:
+        records: The matched memory records, aligned with ``scores``.
+        scores: Similarity/relevance score of each record.
+    """
+
+    records: List[MemoryRecord] = Field(default_factory=list)
+    scores: NDArrayF32 = Field(default_factory=lambda: np.empty(0, dtype=np.float32))
+
+    @model_validator(mode="after")
+    def _check_aligned(self) -> "MemoryHitBatch":
+        """Ensure there is exactly one score per record."""
+        if len(self.records) != len(self.scores):
+            raise ValueError(f"Got {len(self.records)} records but {len(self.scores)} scores")
+        return self
+
+    @classmethod
+    def from_hits(cls, hits: List[MemoryHit]) -> "MemoryHitBatch":
+        """Build a batch from individual hits.
+
+        Args:
+            hits: The hits to gather.
+
+        Returns:
+            A batch holding the same records and scores.
+        """
+        return cls(
+            records=[hit.record for hit in hits],
+            scores=np.fromiter((hit.score for hit in hits), dtype=np.float32, count=len(hits)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        """IDs of the records, in batch order."""
+        return [record.id for record in self.records]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Record embeddings stacked into a contiguous (K, D) float32 matrix.
+
+        Raises:
+            ValueError: If any record has no embedding.
+        """
+        if any(record.vector is None for record in self.records):
+            raise ValueError("All records need an embedding to stack vectors")
+        if not self.records:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([record.vector for record in self.records])
+
+    def _take(self, indices: np.ndarray, scores: Optional[np.ndarray] = None) -> "MemoryHitBatch":
+        """Select records by position, optionally replacing their scores."""
+        source = self.scores if scores is None else scores
+        return MemoryHitBatch(
+            records=[self.records[i] for i in indices.tolist()],
+            scores=source[indices],
+        )
+
+    def top_k(self, k: int) -> "MemoryHitBatch":
+        """Keep the ``k`` highest-scoring hits, best first.
+
+        Args:
+            k: Number of hits to keep.
+
+        Returns:
+            A new batch sorted by descending score.
+        """
+        if k <= 0:
+            return MemoryHitBatch()
+        negated = -self.scores
+        if k < len(self):
+            candidates = np.argpartition(negated, k - 1)[:k]
+            order = candidates[np.argsort(negated[candidates], kind="stable")]
+        else:
+            order = np.argsort(negated, kind="stable")
+        return self._take(order)
+
+    def filter_min_score(self, min_score: float) -> "MemoryHitBatch":
+        """Drop hits scoring below a threshold.
+
+        Args:
+            min_score: Minimum score to keep.
+
+        Returns:
+            A new batch with the remaining hits in their original order.
+        """
+        return self._take(np.flatnonzero(self.scores >= min_score))
+
+    def rerank(self, query_vector: Any) -> "MemoryHitBatch":
+        """Rescore hits by dot product against a query embedding.
+
+        Args:
+            query_vector: Query embedding with the same dimension as the records.
+
+        Returns:
+            A new batch scored by ``vectors @ query_vector``, best first.
+        """
+        if not self.records:
+            return MemoryHitBatch()
+        query = _to_float32_array(query_vector)
+        scores = self.vectors @ query
+        return self._take(np.argsort(-scores, kind="stable"), scores=scores)
+
+    def to_hits(self) -> List[MemoryHit]:
+        """Convert back to a list of ``MemoryHit``.
+
+        Negative scores (possible after ``rerank``) are clamped to 0.0,
+        since ``MemoryHit.score`` must be non-negative.
+
+        Returns:
+            One hit per record, in batch order.
+        """
+        scores = np.maximum(self.scores, 0.0).tolist()
+        return [MemoryHit(record=record, score=score) for record, score in zip(self.records, scores)]
+
+
 class MemoryContext(BaseModel):
     """Aggregated memory context ready for prompt injection.
 
@@ -143,21 +326,34 @@ class MemoryContext(BaseModel):
         Returns:
             Formatted text containing relevant memories and social context.
         """
-        parts = []
-
+        buf = io.StringIO()
+        length = 0
+
+        def write(part: str) -> bool:
+            """Append a line; return False once the budget is exceeded."""
+            nonlocal length
+            if length:
+                length += buf.write("\n")
+            length += buf.write(part)
+            return length <= max_length
+
+        within_budget = True
         if self.social_context:
-            parts.append(f"[Social Context]\n{self.social_context}\n")
+            within_budget = write(f"[Social Context]\n{self.social_context}\n")
 
-        if self.memories:
-            parts.append("[Relevant Memories]")
+        if self.memories and within_budget:
+            within_budget = write("[Relevant Memories]")
             for i, hit in enumerate(self.memories, 1):
-                memory_text = f"{i}. [{hit.record.memory_type.value}] {hit.record.content}"
-                if hit.record.related_agents:
-                    memory_text += f" (involving: {', '.join(hit.record.related_agents)})"
-                parts.append(memory_text)
-
-        result = "\n".join(parts)
-        if len(result) > max_length:
+                if not within_budget:
+                    break
+                record = hit.record
+                memory_text = f"{i}. [{record.memory_type.value}] {record.content}"
+                if record.related_agents:
+                    memory_text += f" (involving: {', '.join(record.related_agents)})"
+                within_budget = write(memory_text)
+
+        result = buf.getvalue()
+        if length > max_length:
             result = result[: max_length - 3] + "..."
         return result
 
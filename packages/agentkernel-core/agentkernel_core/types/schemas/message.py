@@ -81,7 +81,7 @@ class MessageContent(BaseModel):
         return self.model_dump(exclude_none=True, exclude_defaults=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Serializable structure representing a message passed within the system.
 
@@ -6,10 +6,14 @@ for tools that can be called by LLMs using function calling / tool use.
 
 from __future__ import annotations
 
+import copy
+import inspect
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from agentkernel_core.toolkit.introspection import input_schema as _input_schema
 
 
 class ToolSafety(BaseModel):
@@ -25,6 +29,8 @@ class ToolSafety(BaseModel):
         audit_required: Whether tool calls should be logged for audit.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     side_effect: bool = False
     requires_network: bool = False
     requires_fs: bool = False
@@ -34,6 +40,23 @@ class ToolSafety(BaseModel):
     audit_required: bool = False
 
 
+# Most tools use the default safety profile, so ToolSpecs share this frozen
+# instance instead of allocating their own.
+_DEFAULT_SAFETY = ToolSafety()
+
+
+def _empty_input_schema() -> Dict[str, Any]:
+    """Return a fresh schema for a tool without parameters."""
+    return {"type": "object", "properties": {}}
+
+# Fields copied into the cached provider formats
+_PROVIDER_FORMAT_FIELDS = frozenset({"name", "description", "input_schema"})
+
+# Field bounds, also checked by from_function before it skips validation
+_MAX_NAME_LENGTH = 128
+_MAX_DESCRIPTION_LENGTH = 4096
+
+
 class ToolSpec(BaseModel):
     """Standard tool specification compatible with OpenAI function calling.
 
@@ -49,30 +72,47 @@ class ToolSpec(BaseModel):
         safety: Safety metadata for the tool.
         examples: Optional list of example invocations.
         tags: Optional tags for categorization.
+
+    The provider formats are built once and the same dict is returned on
+    every call (treat it as read-only); assigning ``name``, ``description``
+    or ``input_schema`` rebuilds them.
     """
 
-    name: str = Field(..., min_length=1, max_length=128)
-    description: str = Field(..., min_length=1, max_length=4096)
-    input_schema: Dict[str, Any] = Field(default_factory=lambda: {"type": "object", "properties": {}})
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = Field(..., min_length=1, max_length=_MAX_NAME_LENGTH)
+    description: str = Field(..., min_length=1, max_length=_MAX_DESCRIPTION_LENGTH)
+    input_schema: Dict[str, Any] = Field(default_factory=_empty_input_schema)
     output_schema: Optional[Dict[str, Any]] = None
-    safety: ToolSafety = Field(default_factory=ToolSafety)
+    safety: ToolSafety = Field(default_factory=lambda: _DEFAULT_SAFETY)
     examples: List[Dict[str, Any]] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
 
+    _openai_function: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _anthropic_tool: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _PROVIDER_FORMAT_FIELDS:
+            self._openai_function = None
+            self._anthropic_tool = None
+
     def to_openai_function(self) -> Dict[str, Any]:
         """Convert to OpenAI function calling format.
 
         Returns:
             Dict suitable for OpenAI's tools parameter.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.input_schema,
-            },
-        }
+        if self._openai_function is None:
+            self._openai_function = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.input_schema,
+                },
+            }
+        return self._openai_function
 
     def to_anthropic_tool(self) -> Dict[str, Any]:
         """Convert to Anthropic tool format.
@@ -80,11 +120,13 @@ class ToolSpec(BaseModel):
         Returns:
             Dict suitable for Anthropic's tools parameter.
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.input_schema,
-        }
+        if self._anthropic_tool is None:
+            self._anthropic_tool = {
+                "name": self.name,
+                "description": self.description,
+                "input_schema": self.input_schema,
+            }
+        return self._anthropic_tool
 
     @classmethod
     def from_function(
@@ -105,88 +147,25 @@ class ToolSpec(BaseModel):
         Returns:
             ToolSpec instance.
         """
-        import inspect
-        from typing import get_type_hints
-
         func_name = name or func.__name__
         func_desc = description or (inspect.getdoc(func) or f"Execute {func_name}")
-
-        # Build input schema from type hints
-        hints = get_type_hints(func) if hasattr(func, "__annotations__") else {}
-        sig = inspect.signature(func)
-
-        properties: Dict[str, Any] = {}
-        required: List[str] = []
-
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "cls"):
-                continue
-
-            param_type = hints.get(param_name, Any)
-            json_type = _python_type_to_json_schema(param_type)
-
-            properties[param_name] = json_type
-
-            if param.default is inspect.Parameter.empty:
-                required.append(param_name)
-
-        input_schema = {
-            "type": "object",
-            "properties": properties,
-        }
-        if required:
-            input_schema["required"] = required
-
-        return cls(
+        input_schema = _input_schema(func)
+
+        # Only the introspected name and docstring can violate the field bounds; let validation report them
+        within_bounds = len(func_name) <= _MAX_NAME_LENGTH and len(func_desc) <= _MAX_DESCRIPTION_LENGTH
+        if kwargs or not func_name or not within_bounds:
+            return cls(
+                name=func_name,
+                description=func_desc,
+                input_schema=copy.deepcopy(input_schema),
+                **kwargs,
+            )
+
+        # Everything came from introspection, so skip re-validating it; the
+        # cached schema is copied because specs may be edited in place
+        return cls.model_construct(
             name=func_name,
             description=func_desc,
-            input_schema=input_schema,
-            **kwargs,
+            input_schema=copy.deepcopy(input_schema),
         )
 
-
-def _python_type_to_json_schema(python_type: Any) -> Dict[str, Any]:
-    """Convert a Python type to JSON Schema type.
-
-    Args:
-        python_type: The Python type to convert.
-
-    Returns:
-        JSON Schema type definition.
-    """
-    import typing
-
-    origin = typing.get_origin(python_type)
-    args = typing.get_args(python_type)
-
-    # Handle Optional
-    if origin is typing.Union and type(None) in args:
-        non_none_args = [a for a in args if a is not type(None)]
-        if len(non_none_args) == 1:
-            schema = _python_type_to_json_schema(non_none_args[0])
-            return schema
-
-    # Handle List
-    if origin is list:
-        item_type = args[0] if args else Any
-        return {"type": "array", "items": _python_type_to_json_schema(item_type)}
-
-    # Handle Dict
-    if origin is dict:
-        return {"type": "object"}
-
-    # Basic types
-    type_map = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        type(None): {"type": "null"},
-    }
-
-    if python_type in type_map:
-        return type_map[python_type]
-
-    # Default to string for unknown types
-    return {"type": "string"}
-
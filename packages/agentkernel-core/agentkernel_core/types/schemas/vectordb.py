@@ -6,9 +6,14 @@ vectordb_adapters while adding additional fields for the Memory Layer.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from annotated_types import Ge, Le
+from pydantic import BaseModel, ConfigDict, Field
+
+# Schemas that many processes import but few instantiate compile their
+# validators on first use instead of at import time.
+_DEFERRED_CONFIG = ConfigDict(defer_build=True)
 
 
 class VectorDocument(BaseModel):
@@ -50,14 +55,31 @@ class VectorSearchRequest(BaseModel):
         agent_id: Optional agent ID filter.
         doc_type: Optional document type filter.
         min_score: Minimum similarity score threshold.
+        with_vectors: Whether hits should carry their stored vectors.
     """
 
     query: Union[str, List[float]]
-    top_k: int = Field(default=10, ge=1, le=100)
+    top_k: Annotated[int, Ge(1), Le(100)] = 10
     filter: Optional[str] = None
     agent_id: Optional[str] = None
     doc_type: Optional[str] = None
     min_score: Optional[float] = None
+    with_vectors: bool = False
+
+    @classmethod
+    def trusted(cls, **kwargs: Any) -> "VectorSearchRequest":
+        """Build a request from values the caller has already validated.
+
+        Skips validation entirely, so ``top_k`` must already be within
+        [1, 100] and ``query`` must be a string or list of floats.
+
+        Args:
+            **kwargs: Field values for the request.
+
+        Returns:
+            The unvalidated VectorSearchRequest.
+        """
+        return cls.model_construct(**kwargs)
 
 
 class VectorSearchResult(BaseModel):
@@ -70,6 +92,8 @@ class VectorSearchResult(BaseModel):
             implementation.
     """
 
+    model_config = _DEFERRED_CONFIG
+
     document: VectorDocument
     score: float
 
@@ -85,6 +109,8 @@ class VectorStoreInfo(BaseModel):
         metric_type: The distance metric used (e.g., 'cosine', 'l2').
     """
 
+    model_config = _DEFERRED_CONFIG
+
     doc_count: int
     vector_dim: int
     backend: str = "unknown"
@@ -106,6 +132,8 @@ class VectorDBConfig(BaseModel):
         extra_params: Additional backend-specific parameters.
     """
 
+    model_config = _DEFERRED_CONFIG
+
     backend: str = "qdrant"
     host: str = "localhost"
     port: int = 6333
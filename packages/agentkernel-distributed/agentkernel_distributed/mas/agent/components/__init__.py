@@ -1,10 +1,32 @@
-from .profile import ProfileComponent
-from .state import StateComponent
-from .perceive import PerceiveComponent
-from .plan import PlanComponent
-from .reflect import ReflectComponent
-from .invoke import InvokeComponent
-from .memory import MemoryComponent
+import importlib
+from typing import Any, List
+
+# Components are imported on first access (PEP 562) so loading one does not
+# import every other component and its dependencies.
+_COMPONENTS = {
+    "ProfileComponent": ".profile",
+    "StateComponent": ".state",
+    "PerceiveComponent": ".perceive",
+    "PlanComponent": ".plan",
+    "ReflectComponent": ".reflect",
+    "InvokeComponent": ".invoke",
+    "MemoryComponent": ".memory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a component class on first access."""
+    if name not in _COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_COMPONENTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List eagerly defined names together with the lazy component exports."""
+    return sorted(set(globals()) | set(_COMPONENTS))
+
 
 __all__ = [
     "ProfileComponent",
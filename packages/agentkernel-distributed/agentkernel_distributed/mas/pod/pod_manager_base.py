@@ -1,7 +1,8 @@
 """Abstract base class defining the pod manager interface."""
 
 import abc
-from typing import Any, Dict, Optional, Type
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from ray.actor import ActorHandle
 
 from ...toolkit.models.router import ModelRouter
@@ -85,6 +86,28 @@ class BasePodManager(abc.ABC):
             bool: True when the message is delivered successfully.
         """
 
+    async def deliver_messages_batch(
+        self, deliveries: List[Tuple[str, Message]]
+    ) -> List[Union[bool, BaseException]]:
+        """
+        Deliver several messages in one call, concurrently.
+
+        Lets remote callers pay a single actor round-trip for a burst of deliveries. A failing
+        delivery does not affect the others: its exception is returned in its slot instead.
+
+        Args:
+            deliveries (List[Tuple[str, Message]]): Pairs of target agent identifier and message.
+
+        Returns:
+            List[Union[bool, BaseException]]: Per-delivery results or exceptions, in the order given.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.deliver_message(to_id, message) for to_id, message in deliveries),
+                return_exceptions=True,
+            )
+        )
+
     @abc.abstractmethod
     async def run_agent_method(
         self, agent_id: str, component_name: str, method_name: str, *args: Any, **kwargs: Any
@@ -173,8 +173,10 @@ class Messager(SystemComponent):
                 if not self._pod_manager:
                     logger.error("Pod manager handle not available; dropping message.")
                 else:
+                    # Store a multi-recipient message once; Ray resolves the top-level ref for every delivery
+                    payload = ray.put(message) if len(recipients) > 1 else message
                     delivery_tasks = [
-                        self._pod_manager.deliver_message.remote(recipient, message) for recipient in recipients
+                        self._pod_manager.deliver_message.remote(recipient, payload) for recipient in recipients
                     ]
                     if delivery_tasks:
                         await asyncio.gather(*delivery_tasks)
@@ -1,3 +1,7 @@
+import importlib
+import importlib.util
+from typing import Any, List
+
 from .agent import (
     PerceptionData,
     ActionOutcome,
@@ -13,43 +17,49 @@ from .vectordb import (
 )
 from .action import ActionResult, CallStatus
 
-# Re-export from agentkernel-core for new types
-try:
-    from agentkernel_core.types.schemas.message import MessageContent
-    from agentkernel_core.types.schemas.tool import ToolSpec, ToolSafety
-    from agentkernel_core.types.schemas.memory import (
-        MemoryRecord,
-        MemoryQuery,
-        MemoryHit,
-        MemoryContext,
-        MemoryType,
-    )
-    from agentkernel_core.types.schemas.graph import (
-        GraphNode,
-        RelationEdge,
-        RelationType,
-        SocialSubgraph,
-    )
-    from agentkernel_core.tools.result import ToolResult, ToolResultStatus
+# Re-export from agentkernel-core for new types. Resolved on first access
+# (PEP 562) so importing these local schemas does not pull in agentkernel-core.
+_CORE_EXPORTS = {
+    "MessageContent": "agentkernel_core.types.schemas.message",
+    "ToolSpec": "agentkernel_core.types.schemas.tool",
+    "ToolSafety": "agentkernel_core.types.schemas.tool",
+    "MemoryRecord": "agentkernel_core.types.schemas.memory",
+    "MemoryQuery": "agentkernel_core.types.schemas.memory",
+    "MemoryHit": "agentkernel_core.types.schemas.memory",
+    "MemoryContext": "agentkernel_core.types.schemas.memory",
+    "MemoryType": "agentkernel_core.types.schemas.memory",
+    "GraphNode": "agentkernel_core.types.schemas.graph",
+    "RelationEdge": "agentkernel_core.types.schemas.graph",
+    "RelationType": "agentkernel_core.types.schemas.graph",
+    "SocialSubgraph": "agentkernel_core.types.schemas.graph",
+    "ToolResult": "agentkernel_core.tools.result",
+    "ToolResultStatus": "agentkernel_core.tools.result",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import agentkernel-core re-exports on first access.
+
+    Names resolve to None when agentkernel-core is not installed, as before.
+    """
+    if name == "_CORE_AVAILABLE":
+        value = importlib.util.find_spec("agentkernel_core") is not None
+    elif name in _CORE_EXPORTS:
+        try:
+            value = getattr(importlib.import_module(_CORE_EXPORTS[name]), name)
+        except ImportError:
+            value = None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List eagerly imported names together with the lazy re-exports."""
+    return sorted(set(globals()) | set(_CORE_EXPORTS))
 
-    _CORE_AVAILABLE = True
-except ImportError:
-    _CORE_AVAILABLE = False
-    # Define stubs for when core is not available
-    MessageContent = None
-    ToolSpec = None
-    ToolSafety = None
-    MemoryRecord = None
-    MemoryQuery = None
-    MemoryHit = None
-    MemoryContext = None
-    MemoryType = None
-    GraphNode = None
-    RelationEdge = None
-    RelationType = None
-    SocialSubgraph = None
-    ToolResult = None
-    ToolResultStatus = None
 
 __all__ = [
     # Agent types
@@ -22,7 +22,7 @@ class MessageKind(str, Enum):
     FROM_USER_TO_AGENT = "from_user_to_agent"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Serializable structure representing a message passed within the system.
 
@@ -3,7 +3,9 @@
 import inspect
 from abc import ABC, abstractmethod
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from agentkernel_core.toolkit.introspection import input_schema, python_type_to_json_schema
 
 from ....toolkit.utils.annotation import ServiceCall
 
@@ -21,6 +23,36 @@ class ActionPlugin(ABC):
 
     COMPONENT_TYPE: str = "base"
 
+    @classmethod
+    def _annotated_method_names(cls, annotation_type: str) -> Tuple[str, ...]:
+        """
+        Return the names of the class's methods carrying an annotation, in name order.
+
+        The class is scanned with ``dir()`` on the first ``prepare`` call and the result
+        is kept for the class, together with the metadata ``prepare`` builds from it.
+        Methods assigned onto the class after that are not picked up; attach them to
+        instances (e.g. via ``add_method``) instead, which is checked on every call.
+
+        Args:
+            annotation_type (str): Annotation tag used to discover methods.
+
+        Returns:
+            Tuple[str, ...]: Names of the class-level methods tagged with ``annotation_type``.
+        """
+        annotated = cls.__dict__.get("_annotated_methods")
+        if annotated is None:
+            found: Dict[str, List[str]] = {}
+            for method_name in dir(cls):
+                method = inspect.getattr_static(cls, method_name)
+                func = getattr(method, "__func__", method)
+                annotation = getattr(func, "_annotation", None)
+                if annotation is not None and callable(func):
+                    found.setdefault(annotation, []).append(method_name)
+            annotated = {annotation: tuple(names) for annotation, names in found.items()}
+            cls._annotated_methods = annotated
+            cls._prepared_by_annotation = {}
+        return annotated.get(annotation_type, ())
+
     def __init__(self) -> None:
         """Initialize dependency placeholders for subclasses."""
         self.model: Optional[ModelRouter] = None
@@ -58,27 +90,58 @@ class ActionPlugin(ABC):
         Returns:
             List[Dict[str, Any]]: Metadata describing each callable with ToolSpec-compatible format.
         """
-        methods: List[Dict[str, Any]] = []
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            is_annotated = callable(method) and getattr(method, "_annotation", None) == annotation_type
-            if not is_annotated:
-                continue
+        # Class-level methods are described once per class, bound without the instance dict
+        cls = type(self)
+        class_names = cls._annotated_method_names(annotation_type)
+        class_methods = cls._prepared_by_annotation.get(annotation_type)
+        if class_methods is None:
+            class_methods = []
+            for method_name in class_names:
+                method = inspect.getattr_static(cls, method_name)
+                if hasattr(method, "__get__"):
+                    method = method.__get__(self, cls)
+                class_methods.append(self._describe_method(method_name, method))
+            cls._prepared_by_annotation[annotation_type] = class_methods
+
+        # Common case: nothing on the instance touches the annotated methods, and
+        # the class entries are already in name order
+        instance_attrs = vars(self)
+        if instance_attrs.keys().isdisjoint(class_names) and not any(
+            callable(method) and getattr(method, "_annotation", None) == annotation_type
+            for method in instance_attrs.values()
+        ):
+            return [dict(entry) for entry in class_methods]
+
+        # Methods attached to this instance (e.g. via add_method) shadow class attributes
+        methods = {entry["name"]: entry for entry in class_methods}
+        for method_name, method in instance_attrs.items():
+            if callable(method) and getattr(method, "_annotation", None) == annotation_type:
+                methods[method_name] = self._describe_method(method_name, method)
+            else:
+                methods.pop(method_name, None)
+
+        return [dict(methods[method_name]) for method_name in sorted(methods)]
+
+    def _describe_method(self, method_name: str, method: Callable[..., Any]) -> Dict[str, Any]:
+        """Build the ToolSpec-compatible metadata for one annotated method.
 
-            description = inspect.getdoc(method) or ""
+        Args:
+            method_name: Attribute name the method is exposed under.
+            method: The annotated callable.
 
-            # Generate input_schema from method signature for ToolSpec compatibility
-            input_schema = self._generate_input_schema(method)
+        Returns:
+            Dict with the method's name, description and input schema.
+        """
+        description = inspect.getdoc(method) or ""
 
-            methods.append(
-                {
-                    "name": method_name,
-                    "description": description.strip(),
-                    "input_schema": input_schema,
-                }
-            )
+        # Generate input_schema from method signature for ToolSpec compatibility
+        input_schema = self._generate_input_schema(method)
 
-        return methods
+        return {
+            "name": method_name,
+            "description": description.strip(),
+            "input_schema": input_schema,
+        }
 
     def _generate_input_schema(self, method: Callable[..., Any]) -> Dict[str, Any]:
         """Generate JSON Schema for a method's parameters.
@@ -87,39 +150,9 @@ class ActionPlugin(ABC):
             method: The method to introspect.
 
         Returns:
-            JSON Schema dict describing the method's parameters.
+            JSON Schema dict describing the method's parameters. Cached and shared; do not mutate.
         """
-        from typing import get_type_hints, get_origin, get_args, Union
-
-        sig = inspect.signature(method)
-        try:
-            hints = get_type_hints(method)
-        except Exception:
-            hints = {}
-
-        properties: Dict[str, Any] = {}
-        required: List[str] = []
-
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "cls"):
-                continue
-
-            param_type = hints.get(param_name)
-            json_type = self._python_type_to_json_schema(param_type)
-            properties[param_name] = json_type
-
-            # Add description from docstring if available
-            if param.default is inspect.Parameter.empty:
-                required.append(param_name)
-
-        schema: Dict[str, Any] = {
-            "type": "object",
-            "properties": properties,
-        }
-        if required:
-            schema["required"] = required
-
-        return schema
+        return input_schema(method, lenient=True)
 
     def _python_type_to_json_schema(self, python_type: Any) -> Dict[str, Any]:
         """Convert a Python type to JSON Schema type.
@@ -128,45 +161,9 @@ class ActionPlugin(ABC):
             python_type: The Python type to convert.
 
         Returns:
-            JSON Schema type definition.
-        """
-        from typing import get_origin, get_args, Union
-
-        if python_type is None:
-            return {"type": "string"}
-
-        origin = get_origin(python_type)
-        args = get_args(python_type)
-
-        # Handle Optional (Union with None)
-        if origin is Union and type(None) in args:
-            non_none_args = [a for a in args if a is not type(None)]
-            if len(non_none_args) == 1:
-                return self._python_type_to_json_schema(non_none_args[0])
-
-        # Handle List
-        if origin is list:
-            item_type = args[0] if args else Any
-            return {"type": "array", "items": self._python_type_to_json_schema(item_type)}
-
-        # Handle Dict
-        if origin is dict:
-            return {"type": "object"}
-
-        # Basic types
-        type_map = {
-            str: {"type": "string"},
-            int: {"type": "integer"},
-            float: {"type": "number"},
-            bool: {"type": "boolean"},
-            type(None): {"type": "null"},
-        }
-
-        if python_type in type_map:
-            return type_map[python_type]
-
-        # Default to string for unknown types
-        return {"type": "string"}
+            JSON Schema type definition. Cached and shared; do not mutate.
+        """
+        return python_type_to_json_schema(python_type)
 
     async def execute(self, name: str, arguments: Dict[str, Any]) -> Any:
         """
@@ -2,13 +2,23 @@
 API endpoints for reading and writing YAML configuration files.
 """
 
+import asyncio
 import os
+import pickle
+import threading
+from collections import OrderedDict
 import yaml
 from fastapi import APIRouter, HTTPException, Body
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from ..services.simulation_manager import simulation_manager
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 router = APIRouter()
 CONFIGS_DIR = os.path.join(simulation_manager.workspace_path, "configs")
 
@@ -61,6 +71,163 @@ DEFAULT_CONFIGS = {
     },
 }
 
+# Defaults are handed out as fresh clones so no caller can alter the templates;
+# unpickling is cheaper than copy.deepcopy for these nested dicts
+_DEFAULT_PICKLED = {name: pickle.dumps(config, protocol=5) for name, config in DEFAULT_CONFIGS.items()}
+_CONFIG_PATHS = {name: os.path.join(CONFIGS_DIR, name) for name in DEFAULT_CONFIGS}
+# Resolved once; every other config name must resolve to a path below it
+_CONFIGS_DIR_PREFIX = os.path.join(os.path.realpath(CONFIGS_DIR), "")
+_configs_dir_ready = False
+
+
+_MISSING = object()
+
+
+def _default_config(config_name: str, fallback: Any = _MISSING) -> Any:
+    """
+    Return a private copy of a default configuration.
+
+    Args:
+        config_name (str): The name of the configuration file.
+        fallback (Any, optional): Returned when the name has no default; ``_MISSING`` if omitted.
+
+    Returns:
+        Any: A deep copy of the default configuration, or ``fallback``.
+    """
+    pickled = _DEFAULT_PICKLED.get(config_name)
+    return fallback if pickled is None else pickle.loads(pickled)
+
+
+def _config_path(config_name: str) -> str:
+    """
+    Resolve the on-disk path of a configuration file.
+
+    Args:
+        config_name (str): The name of the configuration file.
+
+    Returns:
+        str: The path inside ``CONFIGS_DIR``.
+
+    Raises:
+        HTTPException: If the name resolves to a location outside ``CONFIGS_DIR``.
+    """
+    file_path = _CONFIG_PATHS.get(config_name)
+    if file_path is None:
+        file_path = os.path.join(CONFIGS_DIR, config_name)
+        # Resolving catches absolute names, ".." segments and symlinks out of the directory
+        if not os.path.realpath(file_path).startswith(_CONFIGS_DIR_PREFIX):
+            raise HTTPException(status_code=400, detail="Invalid config name.")
+    return file_path
+
+
+# Parsed YAML by path, validated against the file's (mtime_ns, size) on every read
+_CACHE_MAX = 100
+_yaml_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+def _read_yaml_cached(file_path: str) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    Args:
+        file_path (str): The path to the YAML file.
+
+    Returns:
+        Any: The parsed YAML data. Shared between callers, so it must not be mutated.
+    """
+    st = os.stat(file_path)
+    version = (st.st_mtime_ns, st.st_size)
+
+    with _yaml_cache_lock:
+        entry = _yaml_cache.get(file_path)
+        if entry is not None and entry[0] == version:
+            _yaml_cache.move_to_end(file_path)
+            return entry[1]
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    with _yaml_cache_lock:
+        _yaml_cache[file_path] = (version, data)
+        _yaml_cache.move_to_end(file_path)
+        if len(_yaml_cache) > _CACHE_MAX:
+            _yaml_cache.popitem(last=False)
+    return data
+
+
+def _store_yaml_cache(file_path: str, data: Any) -> None:
+    """
+    Record the parse of a YAML file that was just written from ``data``.
+
+    Args:
+        file_path (str): The path of the freshly written file.
+        data (Any): The document that was serialised to it.
+    """
+    st = os.stat(file_path)
+    with _yaml_cache_lock:
+        _yaml_cache[file_path] = ((st.st_mtime_ns, st.st_size), data)
+        _yaml_cache.move_to_end(file_path)
+        if len(_yaml_cache) > _CACHE_MAX:
+            _yaml_cache.popitem(last=False)
+
+
+def _same_document(a: Any, b: Any) -> bool:
+    """
+    Check whether two YAML documents would be emitted identically.
+
+    Unlike ``==`` this also compares mapping key order and scalar types (``1`` vs ``True``).
+
+    Args:
+        a (Any): The first document.
+        b (Any): The second document.
+
+    Returns:
+        bool: True if both documents have the same structure, order and values.
+    """
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(_same_document(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same_document(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _unchanged_on_disk(file_path: str, content: Any) -> bool:
+    """
+    Check whether a YAML file already holds the given content (blocking).
+
+    A missing, unreadable or malformed file counts as changed so the caller goes on to overwrite it.
+
+    Args:
+        file_path (str): The path to the YAML file.
+        content (Any): The data about to be written.
+
+    Returns:
+        bool: True if the file parses to the same document as ``content``.
+    """
+    try:
+        return _same_document(_read_yaml_cached(file_path), content)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return False
+
+
+def _write_yaml(file_path: str, content: Any) -> None:
+    """
+    Write a YAML file and cache its content as the file's parse (blocking).
+
+    The safe dumper round-trips JSON-compatible data exactly, so the next read
+    needs only a stat instead of a YAML parse.
+
+    Args:
+        file_path (str): The path to the YAML file.
+        content (Any): The data to serialise.
+    """
+    with open(file_path, "w", encoding="utf-8") as f:
+        yaml.dump(content, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+    _store_yaml_cache(file_path, content)
+
 
 @router.get("/{config_name}")
 async def get_config_file(config_name: str):
@@ -76,29 +243,25 @@ async def get_config_file(config_name: str):
     Raises:
         HTTPException: If config name is invalid or file not found without default available.
     """
-    if ".." in config_name or config_name.startswith("/"):
-        raise HTTPException(status_code=400, detail="Invalid config name.")
-
-    file_path = os.path.join(CONFIGS_DIR, config_name)
-    os.makedirs(CONFIGS_DIR, exist_ok=True)
+    global _configs_dir_ready
+    file_path = _config_path(config_name)
+    if not _configs_dir_ready:
+        os.makedirs(CONFIGS_DIR, exist_ok=True)
+        _configs_dir_ready = True
 
     if not os.path.exists(file_path):
-        if config_name in DEFAULT_CONFIGS:
-            return DEFAULT_CONFIGS[config_name]
-        else:
+        default = _default_config(config_name)
+        if default is _MISSING:
             raise HTTPException(
                 status_code=404, detail=f"Config file '{config_name}' not found and no default is available."
             )
+        return default
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = await asyncio.to_thread(_read_yaml_cached, file_path)
 
         if data is None:
-            if config_name in DEFAULT_CONFIGS:
-                return DEFAULT_CONFIGS[config_name]
-            else:
-                return {}
+            return _default_config(config_name, {})
 
         return data
     except Exception as e:
@@ -120,15 +283,15 @@ async def update_config_file(config_name: str, content: Dict[str, Any] = Body(..
     Raises:
         HTTPException: If config name is invalid or write operation fails.
     """
-    if ".." in config_name or config_name.startswith("/"):
-        raise HTTPException(status_code=400, detail="Invalid config name.")
-
-    file_path = os.path.join(CONFIGS_DIR, config_name)
+    file_path = _config_path(config_name)
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(content, f, sort_keys=False, allow_unicode=True)
+        # Saving an unchanged config is common from the UI; skip the emitter and the write
+        if await asyncio.to_thread(_unchanged_on_disk, file_path, content):
+            return {"message": f"Successfully updated '{config_name}'."}
+
+        await asyncio.to_thread(_write_yaml, file_path, content)
         return {"message": f"Successfully updated '{config_name}'."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error writing YAML file: {e}")
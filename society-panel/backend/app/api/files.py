@@ -2,12 +2,13 @@
 API endpoints for file upload, listing, and deletion operations.
 """
 
+import asyncio
 import os
 import shutil
 import zipfile
-import io
 import re
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, AbstractSet, Container, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
 
@@ -16,6 +17,111 @@ from ..services.registry_generator import registry_generator
 
 router = APIRouter()
 
+# Matches package-qualified example imports, e.g. "from examples.demo.plugins"
+_IMPORT_RE = re.compile(rb'(from|import)\s+examples\.\w+\.')
+
+# Largest single archive member we agree to extract (guards against zip bombs)
+_MAX_MEMBER_SIZE = 1 << 30
+# Largest total uncompressed size of an archive
+_MAX_ARCHIVE_SIZE = 4 << 30
+# Read granularity when streaming members out of the archive
+_COPY_CHUNK_SIZE = 1 << 20
+# Worker threads for per-file extraction and import rewriting (I/O bound)
+_IO_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+# Never listed: the auto-generated registry and bytecode caches
+_DEFAULT_EXCLUDE = frozenset({'registry.py', '__pycache__'})
+# The workspace listing additionally hides the data folder, which has its own listing
+_PACKAGE_EXCLUDE = _DEFAULT_EXCLUDE | {'data'}
+# Window in which bursts of single deletions collapse into one registry regeneration
+_REGEN_DELAY_SECONDS = 0.2
+
+_regen_pending: Optional[asyncio.Event] = None
+_regen_lock: Optional[asyncio.Lock] = None
+_regen_task: Optional[asyncio.Task] = None
+
+
+async def _registry_regen_worker() -> None:
+    """
+    Regenerate the registry once per burst of scheduled requests.
+    """
+    while True:
+        await _regen_pending.wait()
+        await asyncio.sleep(_REGEN_DELAY_SECONDS)
+        if not _regen_pending.is_set():
+            # Already flushed by an upload, clear or simulation start
+            continue
+        try:
+            await regenerate_registry()
+        except Exception as e:
+            print(f"Warning: Could not regenerate registry. Error: {e}")
+
+
+def _init_regen_state() -> None:
+    """
+    Create the regeneration event and lock on first use, inside the running loop.
+    """
+    global _regen_pending, _regen_lock
+    if _regen_pending is None:
+        _regen_pending = asyncio.Event()
+        _regen_lock = asyncio.Lock()
+
+
+def start_registry_worker() -> None:
+    """
+    Start the background task that performs debounced registry regeneration.
+    """
+    global _regen_task
+    if _regen_task is None or _regen_task.done():
+        _init_regen_state()
+        _regen_task = asyncio.create_task(_registry_regen_worker())
+
+
+async def stop_registry_worker() -> None:
+    """
+    Stop the regeneration task, flushing a pending regeneration first.
+    """
+    global _regen_task
+    if _regen_task is None:
+        return
+    _regen_task.cancel()
+    try:
+        await _regen_task
+    except asyncio.CancelledError:
+        pass
+    _regen_task = None
+    await flush_registry_regen()
+
+
+def _schedule_registry_regen() -> None:
+    """
+    Request a registry regeneration; concurrent requests are coalesced.
+    """
+    start_registry_worker()
+    _regen_pending.set()
+
+
+async def regenerate_registry() -> None:
+    """
+    Regenerate the registry now, absorbing any scheduled regeneration.
+
+    Generations are serialized so a debounced run never interleaves with one
+    triggered by an upload or clear.
+    """
+    _init_regen_state()
+    async with _regen_lock:
+        _regen_pending.clear()
+        await registry_generator.generate_registry_file(simulation_manager.workspace_path)
+
+
+async def flush_registry_regen() -> None:
+    """
+    Run a scheduled registry regeneration immediately instead of after the debounce window.
+
+    Call this before reading registry.py so a recent deletion is reflected in it.
+    """
+    if _regen_pending is not None and _regen_pending.is_set():
+        await regenerate_registry()
+
 
 def _rewrite_imports_in_file(file_path: str) -> bool:
     """
@@ -28,16 +134,17 @@ def _rewrite_imports_in_file(file_path: str) -> bool:
         bool: True if the file was modified, False otherwise.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
 
-        pattern = r'(from|import)\s+examples\.\w+\.'
-        replacement = r'\1 '
+        # Most files import nothing from examples; a substring scan rules them out cheaply
+        if b'examples.' not in content:
+            return False
 
-        new_content, num_subs = re.subn(pattern, replacement, content)
+        new_content, num_subs = _IMPORT_RE.subn(rb'\1 ', content)
 
         if num_subs > 0:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'wb') as f:
                 f.write(new_content)
             print(f"Rewrote {num_subs} import(s) in: {os.path.basename(file_path)}")
             return True
@@ -47,53 +154,87 @@ def _rewrite_imports_in_file(file_path: str) -> bool:
         return False
 
 
-async def _unpack_zip_and_get_py_files(file: UploadFile, target_base_path: str) -> Tuple[int, List[str]]:
+def _extract_zip(archive: IO[bytes], target_base_path: str) -> Tuple[int, List[str]]:
     """
-    Safely unpack a ZIP file to the specified base path.
+    Validate and extract every member of a ZIP archive (blocking).
 
     Args:
-        file (UploadFile): The uploaded ZIP file.
+        archive (IO[bytes]): A seekable binary file containing the archive.
         target_base_path (str): The target directory to extract files to.
 
     Returns:
         Tuple[int, List[str]]: A tuple containing the count of saved files and list of Python file paths.
 
     Raises:
-        HTTPException: If file is not a valid ZIP archive.
+        HTTPException: If a member or the archive as a whole is too large.
+        zipfile.BadZipFile: If the file is not a valid ZIP archive.
     """
-    if not file.filename.endswith('.zip'):
-        raise HTTPException(status_code=400, detail="Invalid file type. Please upload a .zip file.")
+    # Trailing separator so a sibling such as "workspace2" does not pass as inside "workspace"
+    base_prefix = os.path.join(os.path.normpath(target_base_path), '')
+    with zipfile.ZipFile(archive, 'r') as zf:
+        members = zf.infolist()
+        if sum(member.file_size for member in members) > _MAX_ARCHIVE_SIZE:
+            raise HTTPException(status_code=413, detail="Archive exceeds the total uncompressed size limit.")
+
+        # Validate every member before writing anything; later duplicates win, as before
+        work: Dict[str, zipfile.ZipInfo] = {}
+        for member in members:
+            if member.is_dir() or member.filename.startswith('__MACOSX/'):
+                continue
 
-    saved_files_count = 0
-    py_file_paths = []
+            target_path = os.path.join(target_base_path, member.filename)
+            normalized_path = os.path.normpath(target_path)
 
-    try:
-        zip_content = await file.read()
+            if not normalized_path.startswith(base_prefix):
+                print(f"Skipping potentially malicious file path: {member.filename}")
+                continue
+
+            if member.file_size > _MAX_MEMBER_SIZE:
+                raise HTTPException(
+                    status_code=413, detail=f"Archive member '{member.filename}' exceeds the size limit."
+                )
 
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
-            for member in zf.infolist():
-                if member.is_dir() or member.filename.startswith('__MACOSX/'):
-                    continue
+            work[normalized_path] = member
 
-                target_path = os.path.join(target_base_path, member.filename)
-                normalized_path = os.path.normpath(target_path)
+        # Create each destination directory once rather than once per member
+        for directory in sorted({os.path.dirname(path) for path in work}):
+            os.makedirs(directory, exist_ok=True)
 
-                if not normalized_path.startswith(os.path.normpath(target_base_path)):
-                    print(f"Skipping potentially malicious file path: {member.filename}")
-                    continue
+        def _extract_one(item: Tuple[str, zipfile.ZipInfo]) -> None:
+            normalized_path, member = item
+            # ZipFile serialises reads of the shared handle internally; decompression and writes overlap
+            with zf.open(member, 'r') as source, open(normalized_path, 'wb') as target:
+                shutil.copyfileobj(source, target, _COPY_CHUNK_SIZE)
+            print(f"Saved: {normalized_path}")
 
-                destination_dir = os.path.dirname(normalized_path)
-                os.makedirs(destination_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            list(executor.map(_extract_one, work.items()))
 
-                with zf.open(member, 'r') as source, open(normalized_path, 'wb') as target:
-                    shutil.copyfileobj(source, target)
+    return len(work), [path for path in work if path.endswith('.py')]
 
-                saved_files_count += 1
-                if normalized_path.endswith('.py'):
-                    py_file_paths.append(normalized_path)
 
-                print(f"Saved: {normalized_path}")
+async def _unpack_zip_and_get_py_files(file: UploadFile, target_base_path: str) -> Tuple[int, List[str]]:
+    """
+    Safely unpack a ZIP file to the specified base path.
 
+    Args:
+        file (UploadFile): The uploaded ZIP file.
+        target_base_path (str): The target directory to extract files to.
+
+    Returns:
+        Tuple[int, List[str]]: A tuple containing the count of saved files and list of Python file paths.
+
+    Raises:
+        HTTPException: If file is not a valid ZIP archive or a member is too large.
+    """
+    if not file.filename.endswith('.zip'):
+        raise HTTPException(status_code=400, detail="Invalid file type. Please upload a .zip file.")
+
+    try:
+        # UploadFile.file is a seekable spooled temp file, so the archive is read in place
+        return await asyncio.to_thread(_extract_zip, file.file, target_base_path)
+    except HTTPException:
+        raise
     except zipfile.BadZipFile:
         raise HTTPException(status_code=400, detail="The uploaded file is not a valid ZIP archive.")
     except Exception as e:
@@ -101,7 +242,51 @@ async def _unpack_zip_and_get_py_files(file: UploadFile, target_base_path: str)
     finally:
         await file.close()
 
-    return saved_files_count, py_file_paths
+
+def _rewrite_imports_in_files(py_files: List[str]) -> int:
+    """
+    Rewrite example imports across many Python files in parallel (blocking).
+
+    Args:
+        py_files (List[str]): The Python files to process.
+
+    Returns:
+        int: The number of files that were modified.
+    """
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        return sum(executor.map(_rewrite_imports_in_file, py_files))
+
+
+def _remove_path(path: str) -> None:
+    """
+    Delete a file or a directory tree (blocking).
+
+    Args:
+        path (str): The file or directory to delete.
+    """
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _clear_directory(path: str, keep: Container[str] = ()) -> None:
+    """
+    Delete all non-hidden entries of a directory (blocking).
+
+    Args:
+        path (str): The directory to clear.
+        keep (Container[str], optional): Entry names to preserve.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name in keep or entry.name.startswith('.'):
+                continue
+            # DirEntry caches the type from readdir, saving a stat per entry
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
 
 
 @router.post("/upload/package")
@@ -125,12 +310,10 @@ async def upload_package_zip(file: UploadFile = File(...)):
     rewritten_count = 0
     if py_files:
         print(f"Scanning {len(py_files)} Python files for import rewriting...")
-        for py_file in py_files:
-            if _rewrite_imports_in_file(py_file):
-                rewritten_count += 1
+        rewritten_count = await asyncio.to_thread(_rewrite_imports_in_files, py_files)
 
     try:
-        await registry_generator.generate_registry_file(workspace_path)
+        await regenerate_registry()
         message = (
             f"Successfully unpacked {saved_files_count} package files. "
             f"Rewrote imports in {rewritten_count} files. Registry has been regenerated."
@@ -158,28 +341,27 @@ async def upload_data_zip(file: UploadFile = File(...)):
     return {"message": f"Successfully unpacked {saved_files_count} data files.", "saved_files_count": saved_files_count}
 
 
-def _get_directory_contents(path: str, exclude: List[str] = None) -> List[str]:
+def _get_directory_contents(path: str, exclude: Optional[AbstractSet[str]] = None) -> List[str]:
     """
     Get a list of directory contents with optional exclusions.
 
     Args:
         path (str): The directory path to list.
-        exclude (List[str], optional): Items to exclude from the listing.
+        exclude (AbstractSet[str], optional): Items to exclude in addition to ``_DEFAULT_EXCLUDE``.
 
     Returns:
         List[str]: A sorted list of item names in the directory.
     """
-    if not os.path.exists(path) or not os.path.isdir(path):
+    if not os.path.isdir(path):
         return []
 
-    exclude_set = set(exclude) if exclude else set()
-    # Always exclude auto-generated files
-    exclude_set.add('registry.py')
-    items = []
-    for item in os.listdir(path):
-        if item not in exclude_set and not item.startswith('.') and item != '__pycache__':
-            items.append(item)
-    return sorted(items)
+    exclude_set = _DEFAULT_EXCLUDE | exclude if exclude else _DEFAULT_EXCLUDE
+    with os.scandir(path) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name not in exclude_set and not entry.name.startswith('.')
+        )
 
 
 @router.get("/list/package", response_model=List[str])
@@ -191,7 +373,7 @@ async def list_package_contents():
         List[str]: A list of file and folder names.
     """
     workspace_path = simulation_manager.workspace_path
-    return _get_directory_contents(workspace_path, exclude=['data'])
+    return await asyncio.to_thread(_get_directory_contents, workspace_path, _PACKAGE_EXCLUDE)
 
 
 @router.get("/list/data", response_model=List[str])
@@ -203,7 +385,7 @@ async def list_data_files():
         List[str]: A list of file and folder names.
     """
     data_path = os.path.join(simulation_manager.workspace_path, "data")
-    return _get_directory_contents(data_path)
+    return await asyncio.to_thread(_get_directory_contents, data_path)
 
 
 @router.delete("/delete/package/{item_name}")
@@ -230,12 +412,9 @@ async def delete_package_item(item_name: str):
         raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found.")
 
     try:
-        if os.path.isdir(item_path):
-            shutil.rmtree(item_path)
-        else:
-            os.remove(item_path)
+        await asyncio.to_thread(_remove_path, item_path)
 
-        await registry_generator.generate_registry_file(workspace_path)
+        _schedule_registry_regen()
 
         return {"message": f"Successfully deleted '{item_name}'."}
     except Exception as e:
@@ -266,10 +445,7 @@ async def delete_data_item(item_name: str):
         raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found.")
 
     try:
-        if os.path.isdir(item_path):
-            shutil.rmtree(item_path)
-        else:
-            os.remove(item_path)
+        await asyncio.to_thread(_remove_path, item_path)
         return {"message": f"Successfully deleted '{item_name}'."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete '{item_name}': {e}")
@@ -289,16 +465,9 @@ async def clear_all_package():
     workspace_path = simulation_manager.workspace_path
 
     try:
-        for item in os.listdir(workspace_path):
-            if item == 'data' or item.startswith('.'):
-                continue
-            item_path = os.path.join(workspace_path, item)
-            if os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-            else:
-                os.remove(item_path)
+        await asyncio.to_thread(_clear_directory, workspace_path, ('data',))
 
-        await registry_generator.generate_registry_file(workspace_path)
+        await regenerate_registry()
 
         return {"message": "Successfully cleared all package files."}
     except Exception as e:
@@ -322,14 +491,7 @@ async def clear_all_data():
         return {"message": "Data directory is already empty."}
 
     try:
-        for item in os.listdir(data_path):
-            if item.startswith('.'):
-                continue
-            item_path = os.path.join(data_path, item)
-            if os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-            else:
-                os.remove(item_path)
+        await asyncio.to_thread(_clear_directory, data_path)
         return {"message": "Successfully cleared all data files."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to clear data files: {e}")
@@ -5,6 +5,7 @@ API endpoints for plugin registry operations.
 from fastapi import APIRouter, HTTPException
 from ..services.simulation_manager import simulation_manager
 from ..services.registry_generator import registry_generator
+from .files import regenerate_registry
 
 router = APIRouter()
 
@@ -39,7 +40,7 @@ async def generate_registry_endpoint():
         HTTPException: If failed to generate registry.py.
     """
     try:
-        await registry_generator.generate_registry_file(simulation_manager.workspace_path)
+        await regenerate_registry()
         return {"message": "registry.py has been successfully regenerated."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate registry.py: {e}")
@@ -2,12 +2,57 @@
 API endpoints for managing Python requirements.txt file.
 """
 
+import asyncio
 import os
+from typing import Optional, Tuple
 from fastapi import APIRouter, HTTPException, Body
 from ..services.simulation_manager import simulation_manager
 
 router = APIRouter()
 REQUIREMENTS_PATH = os.path.abspath(os.path.join(simulation_manager.workspace_path, "..", "requirements.txt"))
+PIP_INSTALLED_MARKER = os.path.abspath(
+    os.path.join(simulation_manager.workspace_path, "..", ".venv", "pip_installed_reqs")
+)
+
+# Last read of requirements.txt, keyed by the file's (mtime_ns, size)
+_requirements_cache: Optional[Tuple[Tuple[int, int], str]] = None
+
+
+def _read_requirements_cached() -> str:
+    """
+    Read requirements.txt, reusing the previous content while the file is unchanged.
+
+    Returns:
+        str: The file content.
+    """
+    global _requirements_cache
+    st = os.stat(REQUIREMENTS_PATH)
+    version = (st.st_mtime_ns, st.st_size)
+
+    cached = _requirements_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(REQUIREMENTS_PATH, "r", encoding="utf-8") as f:
+        content = f.read()
+    _requirements_cache = (version, content)
+    return content
+
+
+def _write_requirements(content: str) -> None:
+    """
+    Write requirements.txt and invalidate the installed-dependencies marker (blocking).
+
+    Args:
+        content (str): The new content to write to requirements.txt.
+    """
+    global _requirements_cache
+    with open(REQUIREMENTS_PATH, "w", encoding="utf-8") as f:
+        f.write(content)
+    _requirements_cache = None
+
+    if os.path.exists(PIP_INSTALLED_MARKER):
+        os.remove(PIP_INSTALLED_MARKER)
 
 
 @router.get("/")
@@ -24,9 +69,7 @@ async def get_requirements():
     if not os.path.exists(REQUIREMENTS_PATH):
         return {"content": ""}
     try:
-        with open(REQUIREMENTS_PATH, "r", encoding="utf-8") as f:
-            content = f.read()
-        return {"content": content}
+        return {"content": await asyncio.to_thread(_read_requirements_cached)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading requirements.txt: {e}")
 
@@ -46,13 +89,7 @@ async def update_requirements(content: str = Body(..., embed=True)):
         HTTPException: If an error occurs while writing the file.
     """
     try:
-        with open(REQUIREMENTS_PATH, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        pip_installed_marker = os.path.join(simulation_manager.workspace_path, "..", ".venv", "pip_installed_reqs")
-        if os.path.exists(pip_installed_marker):
-            os.remove(pip_installed_marker)
-
+        await asyncio.to_thread(_write_requirements, content)
         return {"message": "requirements.txt updated successfully. Dependencies will be re-installed on next start."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error writing requirements.txt: {e}")
@@ -2,8 +2,10 @@
 FastAPI application entry point for SOCIETY-PANEL backend.
 """
 
+import functools
 import inspect
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from typing import Dict, Any, List
 from .api import files, configs, registry, requirements
@@ -23,14 +25,19 @@ async def lifespan(app: FastAPI):
         None: Control is yielded to the application during its lifetime.
     """
     print("SOCIETY-PANEL Backend is starting up...")
+    files.start_registry_worker()
     yield
     print("SOCIETY-PANEL Backend is shutting down...")
+    await files.stop_registry_worker()
     await simulation_manager.cleanup()
+    simulation_manager.stop_api_server()
+    simulation_manager.shutdown_ray()
 
 
 app = FastAPI(
     title="Multi-Agent Simulation Management App",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -66,6 +73,7 @@ async def start_simulation_endpoint():
     Returns:
         dict: The current simulation status.
     """
+    await files.flush_registry_regen()
     status = await simulation_manager.start_simulation()
     return status
 
@@ -93,39 +101,22 @@ async def get_simulation_status():
     return simulation_manager.status
 
 
-@app.get("/api/simulation/commands", tags=["Simulation"])
-async def get_pod_manager_commands():
+@functools.lru_cache(maxsize=8)
+def _describe_commands(pod_manager_class: type) -> List[Dict[str, Any]]:
     """
-    Dynamically retrieve all callable commands and their signatures from PodManager.
-
-    Returns:
-        list: A list of command dictionaries containing name, documentation, and parameters.
+    Build the command descriptions for a PodManager class.
 
-    Raises:
-        HTTPException: If simulation has not been started and failed to pre-initialize builder.
-        HTTPException: If PodManager class is not found.
-    """
-    if simulation_manager._status == SimulationStatus.STOPPED:
-        if not simulation_manager._builder:
-            try:
-                await simulation_manager.start_simulation()
-                await simulation_manager.stop_simulation()
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Simulation has not been started, and failed to pre-initialize builder to get commands: {e}"
-                )
-    if not simulation_manager._builder or not simulation_manager._builder._pod_manager_class:
-        raise HTTPException(status_code=404, detail="PodManager class not found. Is the simulation configured?")
+    A class's methods never change once it is loaded, so the result is cached per class;
+    uploading a new package yields a new class object and therefore a fresh entry.
 
-    pod_manager_class = simulation_manager._builder._pod_manager_class
-    if hasattr(pod_manager_class, '__ray_metadata__'):
-        original_class = pod_manager_class.__ray_metadata__.modified_class
-    else:
-        original_class = pod_manager_class
+    Args:
+        pod_manager_class (type): The unwrapped PodManager class.
 
+    Returns:
+        List[Dict[str, Any]]: Command dictionaries sorted by name. Shared between calls; do not mutate.
+    """
     commands = []
-    for name, method in inspect.getmembers(original_class):
+    for name, method in inspect.getmembers(pod_manager_class):
         if not name.startswith('_') and inspect.isfunction(method) and name not in ["init", "post_init"]:
             sig = inspect.signature(method)
             doc = inspect.getdoc(method) or "No description available."
@@ -154,6 +145,41 @@ async def get_pod_manager_commands():
     return sorted(commands, key=lambda x: x['name'])
 
 
+@app.get("/api/simulation/commands", tags=["Simulation"])
+async def get_pod_manager_commands():
+    """
+    Dynamically retrieve all callable commands and their signatures from PodManager.
+
+    Returns:
+        list: A list of command dictionaries containing name, documentation, and parameters.
+
+    Raises:
+        HTTPException: If simulation has not been started and failed to pre-initialize builder.
+        HTTPException: If PodManager class is not found.
+    """
+    if simulation_manager._status == SimulationStatus.STOPPED:
+        if not simulation_manager._builder:
+            try:
+                await files.flush_registry_regen()
+                await simulation_manager.start_simulation()
+                await simulation_manager.stop_simulation()
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Simulation has not been started, and failed to pre-initialize builder to get commands: {e}"
+                )
+    if not simulation_manager._builder or not simulation_manager._builder._pod_manager_class:
+        raise HTTPException(status_code=404, detail="PodManager class not found. Is the simulation configured?")
+
+    pod_manager_class = simulation_manager._builder._pod_manager_class
+    if hasattr(pod_manager_class, '__ray_metadata__'):
+        original_class = pod_manager_class.__ray_metadata__.modified_class
+    else:
+        original_class = pod_manager_class
+
+    return _describe_commands(original_class)
+
+
 @app.post("/api/simulation/command", tags=["Simulation"])
 async def execute_command_endpoint(payload: Dict[str, Any]):
     """
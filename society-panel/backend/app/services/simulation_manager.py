@@ -3,13 +3,18 @@ Service for managing simulation lifecycle and execution.
 """
 
 import asyncio
+import atexit
+import hashlib
 import os
+import queue
 import sys
+import threading
 import time
 import multiprocessing
-import json
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
 import ray
 from datetime import datetime
 
@@ -19,6 +24,78 @@ from agentkernel_distributed.mas.system import System
 from agentkernel_distributed.mas.interface.server import start_server
 from agentkernel_distributed.types.schemas import Message
 
+# Prefer uvloop for loops created after import (uvicorn's "auto" loop already picks it up)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# How long deliver_message god commands are collected before being sent as one batch
+_MESSAGE_BATCH_WINDOW_SECONDS = 0.001
+
+# God-command parameters whose JSON encoding is at least this large are put in the object store once and passed by
+# reference; the most recent refs are kept so repeating the same payload skips serialization entirely
+_LARGE_PARAM_BYTES = 64 * 1024
+_PARAM_REF_CACHE_SIZE = 32
+
+# How long to wait for a freshly started API server to accept connections, and how often to probe it
+_API_SERVER_READY_TIMEOUT_SECONDS = 10.0
+_API_SERVER_PROBE_INTERVAL_SECONDS = 0.05
+
+# Upper bound on how long start_simulation waits for the loop to finish initializing before returning
+_STARTUP_WAIT_TIMEOUT_SECONDS = 30.0
+
+# Workspace entries that are not shipped to Ray workers and so do not invalidate a running Ray instance
+_WORKSPACE_FINGERPRINT_EXCLUDE = frozenset({"__pycache__", ".git", ".idea", "decoupling_output"})
+
+# Per-tick log lines are buffered and written out once this many accumulate (or once per second)
+_TICK_LOG_FLUSH_INTERVAL = 100
+_TICK_LOG_FLUSH_NS = 1_000_000_000
+
+
+# Tick log chunks are written to stdout by a background thread so a blocked pipe never stalls the event loop
+_tick_log_queue: "queue.Queue[str]" = queue.Queue()
+_tick_log_writer: Optional[threading.Thread] = None
+
+
+def _write_tick_log():
+    """
+    Drain the tick log queue to stdout; runs on the daemon writer thread.
+    """
+    while True:
+        chunk = _tick_log_queue.get()
+        try:
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        except Exception:
+            pass
+        finally:
+            _tick_log_queue.task_done()
+
+
+_MISSING = object()
+
+
+def _parse_iso_or_now(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, falling back to the current time when it is malformed.
+
+    Args:
+        value (str): The timestamp string from a god-command payload.
+
+    Returns:
+        datetime: The parsed timestamp, or now if parsing fails.
+    """
+    if value and value[0].isdigit():
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.now()
+
 
 class SimulationStatus(str, Enum):
     """Enumeration of possible simulation states."""
@@ -45,6 +122,15 @@ class SimulationManager:
         self._system: Optional[System] = None
         self._error_message: Optional[str] = None
         self._api_process: Optional[multiprocessing.Process] = None
+        self._api_server_config: Optional[Dict[str, Any]] = None
+        self._message_batch: List[Tuple[str, Message, asyncio.Future]] = []
+        self._message_flush_task: Optional[asyncio.Task] = None
+        self._registry_stamp: Optional[Tuple[int, int]] = None
+        self._resource_maps: Optional[Dict[str, Any]] = None
+        self._ray_workspace_fingerprint: Optional[frozenset] = None
+        self._param_refs: "OrderedDict[bytes, ray.ObjectRef]" = OrderedDict()
+        self._method_cache: Dict[str, Any] = {}
+        self._ready_event: asyncio.Event = asyncio.Event()
 
         self.workspace_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "workspace"))
         os.makedirs(self.workspace_path, exist_ok=True)
@@ -85,9 +171,13 @@ class SimulationManager:
 
         await self.cleanup()
 
+        self._ready_event = asyncio.Event()
         self._simulation_task = asyncio.create_task(self._run_simulation_loop())
 
-        await asyncio.sleep(1)
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout=_STARTUP_WAIT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            print(f"Simulation still initializing after {_STARTUP_WAIT_TIMEOUT_SECONDS} seconds.")
 
         if self._status == SimulationStatus.ERROR:
             print("Simulation failed during startup.")
@@ -102,6 +192,12 @@ class SimulationManager:
         Execute the core simulation loop.
         """
         try:
+            # Ray stays up between runs; it is only restarted when the workspace it shipped to workers changed
+            fingerprint = await asyncio.to_thread(self._workspace_fingerprint)
+            if ray.is_initialized() and fingerprint != self._ray_workspace_fingerprint:
+                print("Workspace changed since Ray was initialized. Restarting Ray...")
+                self.shutdown_ray()
+
             if not ray.is_initialized():
                 backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
                 current_pythonpath = os.environ.get("PYTHONPATH", "")
@@ -123,33 +219,46 @@ class SimulationManager:
                 }
                 print(f"Initializing Ray with runtime_env: {runtime_env}")
                 ray.init(runtime_env=runtime_env)
+                self._ray_workspace_fingerprint = fingerprint
 
             if self.workspace_path not in sys.path:
                 sys.path.insert(0, self.workspace_path)
 
             try:
-                import importlib
-
-                if "registry" in sys.modules:
-                    importlib.reload(sys.modules["registry"])
-                from registry import RESOURCE_MAPS
+                resource_maps = self._load_resource_maps()
             except (ImportError, FileNotFoundError) as e:
                 raise RuntimeError(f"Failed to load registry: {e}")
 
-            self._builder = Builder(project_path=self.workspace_path, resource_maps=RESOURCE_MAPS)
+            self._builder = Builder(project_path=self.workspace_path, resource_maps=resource_maps)
 
-            if self._builder.config.api_server and not self._api_process:
-                print("API server config found. Starting it in a separate process...")
+            if self._builder.config.api_server:
                 redis_pool_config = self._builder.config.database.pools.get("default_redis")
                 if not redis_pool_config:
                     raise ValueError("API server requires 'default_redis' pool in db_config.yaml")
                 server_config = self._builder.config.api_server.model_dump()
                 server_config["redis_settings"] = redis_pool_config.settings
-                self._api_process = multiprocessing.Process(target=start_server, args=(server_config,), daemon=True)
-                self._api_process.start()
-                print(f"API server process started with PID: {self._api_process.pid}")
-                await asyncio.sleep(3)
 
+                # The server process outlives a run; it is only replaced when it died or its settings changed
+                if self._api_process and (
+                    not self._api_process.is_alive() or server_config != self._api_server_config
+                ):
+                    self.stop_api_server()
+
+                if not self._api_process:
+                    print("API server config found. Starting it in a separate process...")
+                    self._api_process = multiprocessing.Process(
+                        target=start_server, args=(server_config,), daemon=True
+                    )
+                    self._api_process.start()
+                    self._api_server_config = server_config
+                    print(f"API server process started with PID: {self._api_process.pid}")
+                    await self._wait_for_api_server(server_config)
+                else:
+                    print(f"Reusing API server process with PID: {self._api_process.pid}")
+            else:
+                self.stop_api_server()
+
+            self._method_cache.clear()
             self._pod_manager, self._system = await self._builder.init()
 
             print("--- Simulation components initialized ---")
@@ -158,24 +267,51 @@ class SimulationManager:
             print(f"--- Starting Simulation Run for {max_ticks} ticks ---")
 
             self._status = SimulationStatus.RUNNING
-
-            for i in range(max_ticks):
-                if self._status != SimulationStatus.RUNNING:
-                    print(f"Simulation status changed to '{self._status}'. Exiting simulation loop.")
-                    break
-
-                tick_start_time = time.time()
-
-                await self._pod_manager.step_agent.remote()
-                await self._system.run("messager", "dispatch_messages")
-                await self._pod_manager.update_agents_status.remote()
-
-                tick_end_time = time.time()
-                actual_tick_duration = tick_end_time - tick_start_time
-                current_tick = await self._system.run("timer", "get_tick")
-                await self._system.run("timer", "add_tick", duration_seconds=actual_tick_duration)
-
-                print(f"--- Tick {current_tick} finished in {actual_tick_duration:.4f} seconds ---")
+            self._ready_event.set()
+
+            # The timer advance of tick N stays in flight until tick N+1 is about to step
+            pending_add_tick: Optional[asyncio.Future] = None
+            tick_log: List[str] = []
+            last_log_flush_ns = time.monotonic_ns()
+            # This loop is the only caller of add_tick, so the timer's tick is tracked locally from its starting value
+            starting_tick = await self._system.run("timer", "get_tick")
+            try:
+                for i in range(max_ticks):
+                    if self._status is not SimulationStatus.RUNNING:
+                        print(f"Simulation status changed to '{self._status}'. Exiting simulation loop.")
+                        break
+
+                    if pending_add_tick is not None:
+                        await pending_add_tick
+                        pending_add_tick = None
+
+                    tick_start_ns = time.monotonic_ns()
+
+                    await self._pod_manager.step_agent.remote()
+                    await self._system.run("messager", "dispatch_messages")
+                    await self._pod_manager.update_agents_status.remote()
+
+                    tick_end_ns = time.monotonic_ns()
+                    actual_tick_duration = (tick_end_ns - tick_start_ns) / 1e9
+                    current_tick = starting_tick + i
+                    pending_add_tick = asyncio.ensure_future(
+                        self._system.run("timer", "add_tick", duration_seconds=actual_tick_duration)
+                    )
+
+                    tick_log.append(f"--- Tick {current_tick} finished in {actual_tick_duration:.4f} seconds ---")
+                    log_due = tick_end_ns - last_log_flush_ns >= _TICK_LOG_FLUSH_NS
+                    if len(tick_log) >= _TICK_LOG_FLUSH_INTERVAL or log_due:
+                        self._flush_tick_log(tick_log)
+                        last_log_flush_ns = tick_end_ns
+
+                if pending_add_tick is not None:
+                    await pending_add_tick
+            finally:
+                if pending_add_tick is not None and not pending_add_tick.done():
+                    pending_add_tick.cancel()
+                self._flush_tick_log(tick_log)
+                # Keep later prints after the tick log without blocking the loop
+                await self._drain_tick_log()
 
             print("\n--- Simulation Finished ---")
 
@@ -189,10 +325,61 @@ class SimulationManager:
             self._status = SimulationStatus.ERROR
             self._error_message = str(e)
         finally:
+            self._ready_event.set()
             print("Simulation loop finished. Triggering final cleanup.")
             await self.cleanup()
             self._status = SimulationStatus.STOPPED
 
+    def _load_resource_maps(self) -> Dict[str, Any]:
+        """
+        Return the workspace registry's RESOURCE_MAPS, re-importing registry.py only when it changed on disk.
+
+        Returns:
+            Dict[str, Any]: The resource maps exported by the workspace registry.
+
+        Raises:
+            ImportError: If the registry module cannot be imported.
+            FileNotFoundError: If the registry file does not exist.
+        """
+        st = os.stat(os.path.join(self.workspace_path, "registry.py"))
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._resource_maps is not None and stamp == self._registry_stamp and "registry" in sys.modules:
+            return self._resource_maps
+
+        import importlib
+
+        if "registry" in sys.modules:
+            importlib.reload(sys.modules["registry"])
+        from registry import RESOURCE_MAPS
+
+        self._registry_stamp = stamp
+        self._resource_maps = RESOURCE_MAPS
+        return RESOURCE_MAPS
+
+    @staticmethod
+    def _flush_tick_log(lines: List[str]):
+        """
+        Hand buffered tick log lines to the stdout writer thread and clear the buffer.
+
+        Args:
+            lines (List[str]): The buffered log lines; emptied in place.
+        """
+        global _tick_log_writer
+        if lines:
+            if _tick_log_writer is None:
+                _tick_log_writer = threading.Thread(target=_write_tick_log, name="tick-log-writer", daemon=True)
+                _tick_log_writer.start()
+            _tick_log_queue.put("\n".join(lines) + "\n")
+            lines.clear()
+
+    @staticmethod
+    async def _drain_tick_log():
+        """
+        Wait, in a worker thread, until everything queued to the stdout writer has been written.
+        """
+        if _tick_log_writer is not None:
+            await asyncio.to_thread(_tick_log_queue.join)
+
     async def stop_simulation(self):
         """
         Stop the running simulation.
@@ -227,19 +414,13 @@ class SimulationManager:
 
     async def cleanup(self):
         """
-        Clean up simulation resources including API server and Ray actors.
+        Clean up simulation resources including Ray actors and system components.
+
+        Ray and the API server process are left running so the next start skips their bring-up;
+        see shutdown_ray and stop_api_server.
         """
         print("Cleaning up simulation resources...")
 
-        if self._api_process and self._api_process.is_alive():
-            print("Terminating API server process...")
-            self._api_process.terminate()
-            self._api_process.join(timeout=5)
-            if self._api_process.is_alive():
-                print("API server process did not terminate gracefully, killing it.")
-                self._api_process.kill()
-            self._api_process = None
-
         if ray.is_initialized():
             try:
                 pod_manager_actor = ray.get_actor("global_pod_manager")
@@ -249,6 +430,9 @@ class SimulationManager:
             except ValueError:
                 print("Named actor 'global_pod_manager' not found, might have been cleaned up already.")
 
+        self._method_cache.clear()
+        self._cancel_message_batch()
+
         if self._system:
             try:
                 await self._system.close()
@@ -256,13 +440,87 @@ class SimulationManager:
                 print(f"Error closing system components: {e}")
             self._system = None
 
+        self._builder = None
+        self._simulation_task = None
+        print("Cleanup complete.")
+
+    def stop_api_server(self):
+        """
+        Terminate the API server process kept alive across simulation runs.
+        """
+        if self._api_process and self._api_process.is_alive():
+            print("Terminating API server process...")
+            self._api_process.terminate()
+            self._api_process.join(timeout=5)
+            if self._api_process.is_alive():
+                print("API server process did not terminate gracefully, killing it.")
+                self._api_process.kill()
+        self._api_process = None
+        self._api_server_config = None
+
+    async def _wait_for_api_server(self, server_config: Dict[str, Any]):
+        """
+        Wait until the API server accepts TCP connections instead of sleeping for a fixed time.
+
+        Args:
+            server_config (Dict[str, Any]): The settings the server was started with.
+
+        Raises:
+            RuntimeError: If the server process exits before it becomes ready.
+        """
+        host = server_config.get("host", "127.0.0.1")
+        if host in ("0.0.0.0", "::", ""):
+            host = "127.0.0.1"
+        port = server_config.get("port", 8000)
+
+        deadline = time.monotonic() + _API_SERVER_READY_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if not self._api_process or not self._api_process.is_alive():
+                raise RuntimeError("API server process exited during startup.")
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+            except OSError:
+                await asyncio.sleep(_API_SERVER_PROBE_INTERVAL_SECONDS)
+                continue
+            writer.close()
+            print(f"API server is accepting connections on {host}:{port}.")
+            return
+        print(f"API server did not accept connections within {_API_SERVER_READY_TIMEOUT_SECONDS} seconds, continuing.")
+
+    def shutdown_ray(self):
+        """
+        Shut down the Ray runtime kept alive across simulation runs.
+        """
+        self._param_refs.clear()
         if ray.is_initialized():
             print("Shutting down Ray...")
             ray.shutdown()
+        self._ray_workspace_fingerprint = None
 
-        self._builder = None
-        self._simulation_task = None
-        print("Cleanup complete.")
+    def _workspace_fingerprint(self) -> frozenset:
+        """
+        Summarize the workspace files shipped to Ray workers as a set of (path, mtime_ns, size) entries.
+
+        Returns:
+            frozenset: The fingerprint; it differs whenever a file is added, removed or modified.
+        """
+        entries = []
+        stack = [self.workspace_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.name in _WORKSPACE_FINGERPRINT_EXCLUDE:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif not entry.name.endswith(".pyc"):
+                            st = entry.stat(follow_symlinks=False)
+                            entries.append((entry.path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                continue
+        return frozenset(entries)
 
     async def execute_god_command(self, command: str, params: Dict[str, Any]):
         """
@@ -278,37 +536,40 @@ class SimulationManager:
         Raises:
             Exception: If simulation is not running or command is invalid.
         """
-        if self._status != SimulationStatus.RUNNING or not self._pod_manager:
+        if self._status is not SimulationStatus.RUNNING or not self._pod_manager:
             raise Exception("Simulation is not running.")
 
         if command == "deliver_message":
             message_dict = params.get("message")
             if isinstance(message_dict, dict):
                 try:
-                    msg_data = message_dict.copy()
-                    if "created_at" in msg_data and isinstance(msg_data["created_at"], str):
-                        try:
-                            msg_data["created_at"] = datetime.fromisoformat(msg_data["created_at"])
-                        except ValueError:
-                            msg_data["created_at"] = datetime.now()
-                    elif "created_at" not in msg_data:
-                        msg_data["created_at"] = datetime.now()
-
-                    message_obj = Message(**msg_data)
+                    # Keyword unpacking already builds a fresh dict, so the payload is never copied up front
+                    created_at = message_dict.get("created_at", _MISSING)
+                    if created_at is _MISSING:
+                        message_obj = Message(**message_dict, created_at=datetime.now())
+                    elif type(created_at) is str:
+                        message_obj = Message(**{**message_dict, "created_at": _parse_iso_or_now(created_at)})
+                    else:
+                        message_obj = Message(**message_dict)
                     params["message"] = message_obj
                 except Exception as e:
                     raise ValueError(f"Invalid 'message' payload for deliver_message command: {e}")
             else:
                 raise ValueError("The 'deliver_message' command requires a 'message' object in its parameters.")
 
-        if not hasattr(self._pod_manager, command):
-            raise Exception(f"PodManager does not have a command named '{command}'")
+        if command == "deliver_message" and params.keys() == {"to_id", "message"}:
+            return await self._deliver_message_batched(params["to_id"], params["message"])
 
-        method = getattr(self._pod_manager, command)
+        method = self._method_cache.get(command)
+        if method is None:
+            method = getattr(self._pod_manager, command, None)
+            if method is None:
+                raise Exception(f"PodManager does not have a command named '{command}'")
+            self._method_cache[command] = method
 
         params.pop("_ray_trace_ctx", None)
 
-        result = await method.remote(**params)
+        result = await method.remote(**self._ref_large_params(params))
 
         if command == "close" and result is True:
             print("`close` command executed successfully. Stopping simulation loop.")
@@ -316,5 +577,107 @@ class SimulationManager:
 
         return result
 
+    def _ref_large_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace large JSON-native parameter values with object store references.
+
+        Ray resolves top-level ObjectRef arguments before the actor method runs, so the PodManager
+        receives the plain values either way.
+
+        Args:
+            params (Dict[str, Any]): The command parameters.
+
+        Returns:
+            Dict[str, Any]: The parameters to pass to the actor method.
+        """
+        refs = None
+        for name, value in params.items():
+            if not isinstance(value, (str, list, dict)):
+                continue
+            if isinstance(value, str):
+                if len(value) < _LARGE_PARAM_BYTES // 4:
+                    continue
+                encoded = value.encode("utf-8")
+            else:
+                try:
+                    encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+                except TypeError:
+                    continue
+            if len(encoded) < _LARGE_PARAM_BYTES:
+                continue
+
+            key = hashlib.blake2b(encoded, digest_size=16, person=type(value).__name__.encode()).digest()
+            ref = self._param_refs.get(key)
+            if ref is None:
+                ref = ray.put(value)
+                self._param_refs[key] = ref
+                if len(self._param_refs) > _PARAM_REF_CACHE_SIZE:
+                    self._param_refs.popitem(last=False)
+            else:
+                self._param_refs.move_to_end(key)
+            if refs is None:
+                refs = dict(params)
+            refs[name] = ref
+        return params if refs is None else refs
+
+    async def _deliver_message_batched(self, to_id: str, message: Message) -> bool:
+        """
+        Queue a message delivery to be sent together with others arriving in the same window.
+
+        Args:
+            to_id (str): Identifier of the recipient agent.
+            message (Message): Message to deliver.
+
+        Returns:
+            bool: True when the message is delivered successfully.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._message_batch.append((to_id, message, future))
+        if self._message_flush_task is None:
+            self._message_flush_task = asyncio.create_task(self._flush_message_batch())
+        return await future
+
+    def _cancel_message_batch(self):
+        """
+        Cancel a pending message batch flush and fail the deliveries still waiting on it.
+        """
+        if self._message_flush_task is not None:
+            self._message_flush_task.cancel()
+            self._message_flush_task = None
+        batch, self._message_batch = self._message_batch, []
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(Exception("Simulation is not running."))
+
+    async def _flush_message_batch(self):
+        """
+        Send all queued message deliveries to the PodManager in a single actor call.
+        """
+        await asyncio.sleep(_MESSAGE_BATCH_WINDOW_SECONDS)
+        batch, self._message_batch = self._message_batch, []
+        self._message_flush_task = None
+
+        try:
+            if not self._pod_manager:
+                raise Exception("Simulation is not running.")
+            results = await self._pod_manager.deliver_messages_batch.remote(
+                [(to_id, message) for to_id, message, _ in batch]
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Each delivery fails or succeeds on its own
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
 
 simulation_manager = SimulationManager()
+atexit.register(simulation_manager.shutdown_ray)